@@ -1,11 +1,15 @@
 import streamlit as st
 import pandas as pd
-import xlsxwriter
+import numpy as np
+from pandas.util import hash_pandas_object
 from io import BytesIO
-from datetime import datetime, timedelta
-import plotly.express as px
+from datetime import datetime
 import plotly.graph_objects as go
 import calendar
+import functools
+import hashlib
+import importlib.util
+import json
 import os
 
 # ─────────────────────────────────────────────────────────────
@@ -14,183 +18,259 @@ import os
 st.set_page_config(page_title="MS Perfect Team Planning", layout="wide")
 st.title("MS Perfect Team Planning")
 
-# Check for AgGrid availability (used for future projects)
-try:
+# Check for AgGrid availability (used for future projects); the package is imported on first use
+aggrid_available = importlib.util.find_spec("st_aggrid") is not None
+
+@functools.lru_cache(maxsize=None)
+def get_aggrid():
+    """Import AgGrid and its options builder the first time a grid is rendered"""
     from st_aggrid import AgGrid, GridOptionsBuilder
-    aggrid_available = True
-except ImportError:
-    aggrid_available = False
+    return AgGrid, GridOptionsBuilder
+
+# Check for PyExcelerate availability (fast bulk xlsx writer for the Excel export)
+pyexcelerate_available = importlib.util.find_spec("pyexcelerate") is not None
+
+# Check for pyarrow availability (Feather persistence for future projects; pandas imports it when writing)
+pyarrow_available = importlib.util.find_spec("pyarrow") is not None
+
+# Check for numba availability (compiled quarter averaging and large-frame allocation aggregation); compiled on first use
+numba_available = importlib.util.find_spec("numba") is not None
 
 # ─────────────────────────────────────────────────────────────
 # Helper Functions for Quarterly Calculations
 # ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def get_fiscal_quarter(month_str):
-    """Get fiscal quarter based on August start"""
-    try:
-        month_date = datetime.strptime(month_str, "%Y-%m")
-        month = month_date.month
-        year = month_date.year
-        
-        # Fiscal year starts in August
-        # If month is August or later, fiscal year is current year + 1
-        # If month is before August, fiscal year is current year
-        if month >= 8:  # August through December
-            fiscal_year = year + 1
-        else:  # January through July
-            fiscal_year = year
-        
-        if month in [8, 9, 10]:  # Aug-Oct
-            return f"Q1 FY{fiscal_year}"
-        elif month in [11, 12]:  # Nov-Dec
-            return f"Q2 FY{fiscal_year}"
-        elif month in [1]:  # Jan
-            return f"Q2 FY{fiscal_year}"
-        elif month in [2, 3, 4]:  # Feb-Apr
-            return f"Q3 FY{fiscal_year}"
-        else:  # May-Jul (months 5, 6, 7)
-            return f"Q4 FY{fiscal_year}"
-    except:
+    """Get fiscal quarter based on August start (memoized - the same few month strings repeat)"""
+    # Validate "YYYY-MM" explicitly instead of parsing with strptime inside a try
+    if not isinstance(month_str, str):
         return "Unknown"
+    year_text, _, month_text = month_str.partition("-")
+    if not (len(year_text) == 4 and year_text.isdecimal() and 1 <= len(month_text) <= 2 and month_text.isdecimal()):
+        return "Unknown"
+    year = int(year_text)
+    month = int(month_text)
+    if not 1 <= month <= 12:
+        return "Unknown"
+    
+    # Fiscal year starts in August
+    # If month is August or later, fiscal year is current year + 1
+    # If month is before August, fiscal year is current year
+    if month >= 8:  # August through December
+        fiscal_year = year + 1
+    else:  # January through July
+        fiscal_year = year
+    
+    if month in [8, 9, 10]:  # Aug-Oct
+        return f"Q1 FY{fiscal_year}"
+    elif month in [11, 12]:  # Nov-Dec
+        return f"Q2 FY{fiscal_year}"
+    elif month in [1]:  # Jan
+        return f"Q2 FY{fiscal_year}"
+    elif month in [2, 3, 4]:  # Feb-Apr
+        return f"Q3 FY{fiscal_year}"
+    else:  # May-Jul (months 5, 6, 7)
+        return f"Q4 FY{fiscal_year}"
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_month_labels(first_month, count, date_format):
+    """Month labels starting at a "YYYY-MM" month, built once per (month, count, format) and shared across reruns"""
+    return tuple(pd.date_range(first_month, periods=count, freq="MS").strftime(date_format))
+
+def get_next_months(count=12, start=None, date_format="%Y-%m"):
+    """Labels for `count` consecutive calendar months, starting with the month of `start` (default today)"""
+    if start is None:
+        first_month = datetime.now().strftime("%Y-%m")
+    elif isinstance(start, str):
+        # ISO "YYYY-MM-DD" day strings (the cache keys passed by the generators) already begin with the month
+        first_month = start[:7]
+    else:
+        first_month = pd.Timestamp(start).strftime("%Y-%m")
+    return list(get_month_labels(first_month, count, date_format))
+
+def get_quarter_runs(months):
+    """Fiscal quarters of a chronological month window and the column index where each one starts"""
+    window_quarters = get_fiscal_quarter_series(pd.Series(months)).tolist()
+    quarter_starts = np.array([
+        position for position, quarter in enumerate(window_quarters)
+        if position == 0 or quarter != window_quarters[position - 1]
+    ])
+    return [window_quarters[position] for position in quarter_starts], quarter_starts
+
+def get_fiscal_quarter_series(months):
+    """Vectorized get_fiscal_quarter for a Series of "YYYY-MM" strings (unparseable values give "Unknown")"""
+    # Assignment tables repeat a handful of months, so parse and label each distinct value once and broadcast back
+    codes, unique_months = pd.factorize(months)
+    dates = pd.to_datetime(pd.Series(unique_months, dtype=object), format="%Y-%m", errors="coerce")
+    month = dates.dt.month.to_numpy()
+    valid = ~np.isnan(month)
+    
+    # Same August fiscal-year mapping as get_fiscal_quarter: Aug-Oct Q1, Nov-Jan Q2, Feb-Apr Q3, May-Jul Q4
+    fiscal_year = np.where(month >= 8, dates.dt.year.to_numpy() + 1, dates.dt.year.to_numpy())
+    quarter = np.select([month >= 11, month >= 8, month == 1, month >= 5], ['Q2', 'Q1', 'Q2', 'Q4'], default='Q3')
+    
+    # One extra trailing slot labels the missing values (factorize code -1)
+    labels = np.full(len(month) + 1, "Unknown", dtype=object)
+    labels[:-1][valid] = [f"{q} FY{int(fy)}" for q, fy in zip(quarter[valid], fiscal_year[valid])]
+    return pd.Series(labels[codes], index=months.index)
+
+def group_months_by_quarter(months):
+    """Map each fiscal quarter to its months, in order of first appearance (repeated months are kept)"""
+    months = pd.Series(months)
+    return {
+        quarter: quarter_months.tolist()
+        for quarter, quarter_months in months.groupby(get_fiscal_quarter_series(months), sort=False)
+    }
 
 def get_quarter_months(quarter_str):
     """Get the months that belong to a specific quarter"""
-    # Extract year from quarter string (e.g., "Q1 FY2026" -> 2026)
-    try:
-        parts = quarter_str.split()
-        quarter_num = parts[0]
-        fiscal_year = int(parts[1].replace("FY", ""))
-        
-        # Fiscal year 2026 starts in August 2025
-        # So we need to subtract 1 from fiscal year to get the calendar year for Q1-Q2 start
-        if quarter_num == "Q1":
-            # Q1 is Aug-Oct of the previous calendar year
-            return [f"{fiscal_year-1}-08", f"{fiscal_year-1}-09", f"{fiscal_year-1}-10"]
-        elif quarter_num == "Q2":
-            # Q2 is Nov-Dec of previous calendar year and Jan of fiscal year
-            return [f"{fiscal_year-1}-11", f"{fiscal_year-1}-12", f"{fiscal_year}-01"]
-        elif quarter_num == "Q3":
-            # Q3 is Feb-Apr of the fiscal year
-            return [f"{fiscal_year}-02", f"{fiscal_year}-03", f"{fiscal_year}-04"]
-        else:  # Q4
-            # Q4 is May-Jul of the fiscal year
-            return [f"{fiscal_year}-05", f"{fiscal_year}-06", f"{fiscal_year}-07"]
-    except:
+    # Extract year from quarter string (e.g., "Q1 FY2026" -> 2026); anything else has no months
+    parts = quarter_str.split() if isinstance(quarter_str, str) else []
+    if len(parts) < 2 or not parts[1].replace("FY", "").isdecimal():
         return []
+    quarter_num = parts[0]
+    fiscal_year = int(parts[1].replace("FY", ""))
+    
+    # Fiscal year 2026 starts in August 2025
+    # So we need to subtract 1 from fiscal year to get the calendar year for Q1-Q2 start
+    if quarter_num == "Q1":
+        # Q1 is Aug-Oct of the previous calendar year
+        return [f"{fiscal_year-1}-08", f"{fiscal_year-1}-09", f"{fiscal_year-1}-10"]
+    elif quarter_num == "Q2":
+        # Q2 is Nov-Dec of previous calendar year and Jan of fiscal year
+        return [f"{fiscal_year-1}-11", f"{fiscal_year-1}-12", f"{fiscal_year}-01"]
+    elif quarter_num == "Q3":
+        # Q3 is Feb-Apr of the fiscal year
+        return [f"{fiscal_year}-02", f"{fiscal_year}-03", f"{fiscal_year}-04"]
+    else:  # Q4
+        # Q4 is May-Jul of the fiscal year
+        return [f"{fiscal_year}-05", f"{fiscal_year}-06", f"{fiscal_year}-07"]
+
+def average_quarter_allocations_loop(allocation_matrix, assigned_matrix, quarter_starts):
+    """Average each engineer's allocation over the assigned months of every quarter (numba kernel source)"""
+    n_engineers, n_months = allocation_matrix.shape
+    n_quarters = quarter_starts.shape[0]
+    avg_allocations = np.zeros((n_engineers, n_quarters))
+    for q in range(n_quarters):
+        start = quarter_starts[q]
+        end = quarter_starts[q + 1] if q + 1 < n_quarters else n_months
+        for e in range(n_engineers):
+            total = 0.0
+            count = 0.0
+            for m in range(start, end):
+                total += allocation_matrix[e, m]
+                count += assigned_matrix[e, m]
+            if count > 0:
+                avg_allocations[e, q] = total / count
+    return avg_allocations
+
+def average_quarter_allocations_reduceat(allocation_matrix, assigned_matrix, quarter_starts):
+    """Vectorized fallback of the quarter averaging loop (two reduceat passes and a guarded divide)"""
+    quarter_allocations = np.add.reduceat(allocation_matrix, quarter_starts, axis=1)
+    quarter_assigned_months = np.add.reduceat(assigned_matrix, quarter_starts, axis=1)
+    return np.divide(
+        quarter_allocations, quarter_assigned_months,
+        out=np.zeros_like(quarter_allocations), where=quarter_assigned_months > 0
+    )
 
-def generate_team_utilization_summary(monthly_df, engineers_df):
-    """Generate overall team utilization summary by quarter"""
+@st.cache_resource(show_spinner=False)
+def get_quarter_average_kernel():
+    """Compiled quarter averaging loop, held for the server process (None when it disagrees with the reduceat fallback)"""
+    from numba import njit
+    kernel = njit(cache=True)(average_quarter_allocations_loop)
+    # Check the compiled loop against the fallback once, on a sample with an empty quarter and an idle engineer
+    allocation_matrix = np.array([[50.0, 0.0, 25.0, 100.0, 0.0], [0.0, 0.0, 0.0, 80.0, 40.0]])
+    assigned_matrix = np.array([[1.0, 0.0, 1.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0, 1.0]])
+    quarter_starts = np.array([0, 2, 3])
+    if not np.allclose(
+        kernel(allocation_matrix, assigned_matrix, quarter_starts),
+        average_quarter_allocations_reduceat(allocation_matrix, assigned_matrix, quarter_starts)
+    ):
+        return None
+    return kernel
+
+def average_quarter_allocations(allocation_matrix, assigned_matrix, quarter_starts):
+    """Per-quarter average allocation of each engineer over months with assignments (0 when none)"""
+    kernel = get_quarter_average_kernel() if numba_available else None
+    average = kernel if kernel is not None else average_quarter_allocations_reduceat
+    return average(allocation_matrix, assigned_matrix, quarter_starts)
+
+# Row count above which build_allocation_matrices uses the compiled cell accumulator instead of two bincount passes
+NUMBA_AGGREGATION_MIN_ROWS = 50_000
+
+def accumulate_allocation_cells_loop(engineer_codes, month_codes, allocations, n_engineers, n_months):
+    """Sum allocations and flag assigned (engineer, month) cells in one pass, skipping -1 codes (numba kernel source)"""
+    allocation_matrix = np.zeros((n_engineers, n_months))
+    assigned_matrix = np.zeros((n_engineers, n_months))
+    for i in range(engineer_codes.shape[0]):
+        e = engineer_codes[i]
+        m = month_codes[i]
+        if e >= 0 and m >= 0:
+            allocation_matrix[e, m] += allocations[i]
+            assigned_matrix[e, m] = 1.0
+    return allocation_matrix, assigned_matrix
+
+def accumulate_allocation_cells_bincount(engineer_codes, month_codes, allocations, n_engineers, n_months):
+    """Vectorized fallback of the cell accumulator (two bincount passes over the in-window rows)"""
+    in_window = (engineer_codes >= 0) & (month_codes >= 0)
+    cells = engineer_codes[in_window] * n_months + month_codes[in_window]
+    shape = (n_engineers, n_months)
+    allocation_matrix = np.bincount(cells, weights=allocations[in_window], minlength=n_engineers * n_months).reshape(shape)
+    assigned_matrix = (np.bincount(cells, minlength=n_engineers * n_months) > 0).astype(float).reshape(shape)
+    return allocation_matrix, assigned_matrix
+
+@st.cache_resource(show_spinner=False)
+def get_allocation_cells_kernel():
+    """Compiled cell accumulator, held for the server process (None when it disagrees with the bincount fallback)"""
+    from numba import njit
+    kernel = njit(cache=True)(accumulate_allocation_cells_loop)
+    # Check the compiled loop against the fallback once, on a sample with repeated cells, 0% rows and -1 codes
+    engineer_codes = np.array([0, 1, 0, -1, 1, 2])
+    month_codes = np.array([2, 0, 2, 1, -1, 1])
+    allocations = np.array([50.0, 0.0, 25.0, 10.0, 30.0, 60.0])
+    for compiled, fallback in zip(
+        kernel(engineer_codes, month_codes, allocations, 3, 3),
+        accumulate_allocation_cells_bincount(engineer_codes, month_codes, allocations, 3, 3)
+    ):
+        if not np.allclose(compiled, fallback):
+            return None
+    return kernel
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def generate_team_utilization_summary(monthly_df, engineers_df, today):
+    """Generate overall team utilization summary by quarter (today is "YYYY-MM-DD", part of the cache key)"""
     
     # Get all engineers with valid names
-    all_engineers = []
-    for name in engineers_df['Engineer Name'].tolist():
-        if name is not None and str(name).strip() and str(name) != 'nan':
-            all_engineers.append(str(name).strip())
+    all_engineers = get_valid_engineer_names(engineers_df)
     
     if not all_engineers or monthly_df.empty:
         return None
     
     # Generate months for next 12 months
-    current_date = datetime.now()
-    months = []
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
-    
-    # Calculate quarterly team metrics
-    quarterly_metrics = []
-    
-    # Group months by quarter
-    quarters_dict = {}
-    for month in months:
-        quarter = get_fiscal_quarter(month)
-        if quarter not in quarters_dict:
-            quarters_dict[quarter] = []
-        quarters_dict[quarter].append(month)
-    
-    for quarter, quarter_months in quarters_dict.items():
-        total_capacity = len(all_engineers) * 100  # 100% per engineer
-        total_allocated = 0
-        total_effective_allocated = 0
-        engineers_over_allocated = 0
-        engineers_fully_occupied = 0
-        engineers_available = 0
-        
-        # Calculate metrics for each engineer
-        for engineer in all_engineers:
-            engineer_allocation = 0
-            engineer_effective_allocation = 0
-            months_with_assignments = 0
-            
-            for month in quarter_months:
-                # Get allocations
-                month_allocation = 0
-                has_assignment = False
-                
-                if 'Month' in monthly_df.columns:
-                    month_data = monthly_df[(monthly_df['Month'] == month) & 
-                                          (monthly_df['Engineer Name'].astype(str) == str(engineer))]
-                    if not month_data.empty:
-                        month_allocation = month_data['Allocation %'].sum()
-                        has_assignment = True
-                        months_with_assignments += 1
-                
-                # Get PTO adjustment
-                working_days_ratio = 1
-                engineer_matches = engineers_df[engineers_df['Engineer Name'].astype(str) == str(engineer)]
-                
-                if not engineer_matches.empty:
-                    engineer_row = engineer_matches.iloc[0]
-                    month_pto_key = f"PTO_{month.replace('-', '_')}"
-                    if month_pto_key in engineers_df.columns:
-                        pto_days = float(engineer_row.get(month_pto_key, 0))
-                        working_days_in_month = 22
-                        effective_working_days = max(0, working_days_in_month - pto_days)
-                        working_days_ratio = effective_working_days / working_days_in_month if working_days_in_month > 0 else 1
-                
-                if has_assignment:
-                    engineer_allocation += month_allocation
-                    # FIXED: Don't adjust allocation for PTO - it stays the same
-                    engineer_effective_allocation += month_allocation
-            
-            # Calculate quarterly metrics based on months with assignments
-            if months_with_assignments > 0:
-                avg_allocation = engineer_allocation / months_with_assignments
-                avg_effective_allocation = engineer_effective_allocation / months_with_assignments
-            else:
-                avg_allocation = 0
-                avg_effective_allocation = 0
-            
-            total_allocated += avg_allocation
-            total_effective_allocated += avg_effective_allocation
-            
-            # Categorize engineer
-            if avg_effective_allocation > 100:
-                engineers_over_allocated += 1
-            elif avg_effective_allocation >= 85:
-                engineers_fully_occupied += 1
-            else:
-                engineers_available += 1
-        
-        quarterly_metrics.append({
-            'Quarter': quarter,
-            'Team Size': len(all_engineers),
-            'Avg Team Utilization %': round(total_allocated / len(all_engineers), 1),
-            'Avg Effective Utilization %': round(total_effective_allocated / len(all_engineers), 1),
-            'Available Engineers': engineers_available,
-            'Fully Occupied Engineers': engineers_fully_occupied,
-            'Over-allocated Engineers': engineers_over_allocated
-        })
-    
-    if not quarterly_metrics:
-        return None
-    
-    metrics_df = pd.DataFrame(quarterly_metrics)
+    months = get_next_months(12, today)
+    
+    quarters, quarter_starts = get_quarter_runs(months)
+    allocation_matrix, assigned_matrix = build_allocation_matrices(monthly_df, all_engineers, months)
+    
+    # Per-quarter averages over assigned months (PTO does not change allocation)
+    avg_allocations = average_quarter_allocations(allocation_matrix, assigned_matrix, quarter_starts)
+    
+    engineers_over_allocated = (avg_allocations > 100).sum(axis=0)
+    engineers_fully_occupied = ((avg_allocations >= 85) & (avg_allocations <= 100)).sum(axis=0)
+    avg_team_utilization = [round(total / len(all_engineers), 1) for total in avg_allocations.sum(axis=0)]
+    
+    metrics_df = pd.DataFrame({
+        'Quarter': quarters,
+        'Team Size': len(all_engineers),
+        'Avg Team Utilization %': avg_team_utilization,
+        'Avg Effective Utilization %': avg_team_utilization,
+        'Available Engineers': len(all_engineers) - engineers_over_allocated - engineers_fully_occupied,
+        'Fully Occupied Engineers': engineers_fully_occupied,
+        'Over-allocated Engineers': engineers_over_allocated
+    })
     
-    # Sort quarters chronologically
-    sorted_quarters = sort_quarters_chronologically(metrics_df['Quarter'].tolist())
-    metrics_df['Quarter'] = pd.Categorical(metrics_df['Quarter'], categories=sorted_quarters, ordered=True)
-    metrics_df = metrics_df.sort_values('Quarter')
+    # Quarters follow the chronological window, so metrics_df is already sorted
     
     # Create figure with secondary y-axis
     fig = go.Figure()
@@ -201,7 +281,7 @@ def generate_team_utilization_summary(monthly_df, engineers_df):
         x=metrics_df['Quarter'],
         y=metrics_df['Avg Team Utilization %'],
         yaxis='y',
-        text=metrics_df['Avg Team Utilization %'].apply(lambda x: f"{x}%"),
+        text=[f"{x}%" for x in metrics_df['Avg Team Utilization %'].tolist()],
         textposition='inside',
         marker_color='lightblue',
         hovertemplate='%{x}<br>Utilization: %{y}%<extra></extra>'
@@ -212,7 +292,7 @@ def generate_team_utilization_summary(monthly_df, engineers_df):
         x=metrics_df['Quarter'],
         y=metrics_df['Avg Effective Utilization %'],
         yaxis='y',
-        text=metrics_df['Avg Effective Utilization %'].apply(lambda x: f"{x}%"),
+        text=[f"{x}%" for x in metrics_df['Avg Effective Utilization %'].tolist()],
         textposition='inside',
         marker_color='darkblue',
         hovertemplate='%{x}<br>Effective: %{y}%<extra></extra>'
@@ -273,9 +353,459 @@ def generate_team_utilization_summary(monthly_df, engineers_df):
     
     return fig
 
+def quarter_sort_key(quarter):
+    """Sort key for a "Qn FYyyyy" label: (fiscal year, quarter number)"""
+    quarter_num, fiscal_year = quarter.split()
+    return (int(fiscal_year[2:]), int(quarter_num[1]))
+
+@functools.lru_cache(maxsize=64)
+def sort_quarter_tuple(quarters):
+    """Chronological sort of a tuple of quarter labels, memoized within one run (charts re-sort the same few sets)"""
+    return tuple(sorted(quarters, key=quarter_sort_key))
+
 def sort_quarters_chronologically(quarters):
     """Sort quarters in chronological order (by fiscal year then quarter number)"""
-    return sorted(quarters, key=lambda x: (int(x.split()[1].replace('FY', '')), int(x.split()[0][1])))
+    return list(sort_quarter_tuple(tuple(quarters)))
+
+def normalize_engineer_names(df):
+    """Coerce Engineer Name to stripped strings - call only where data enters or is committed"""
+    df['Engineer Name'] = df['Engineer Name'].fillna('').astype(str).str.strip()
+    return df
+
+def add_missing_pto_columns(df, month_keys):
+    """Append zero-filled PTO columns absent from df in one concat; returns (df, added_keys)"""
+    added_keys = [key for key in dict.fromkeys(month_keys) if key not in df.columns]
+    if added_keys:
+        df = pd.concat([df, pd.DataFrame(0, index=df.index, columns=added_keys)], axis=1)
+    return df, added_keys
+
+def coerce_pto_columns(df, pto_columns):
+    """Convert all PTO columns to numbers (invalid -> 0) in a single block assignment"""
+    # Values stay float64/int64: they are shown in widgets and labels and round-tripped through the CSV,
+    # where float32 would surface rounding (e.g. 33.3 -> 33.29999923706055) and the frames are small anyway
+    if pto_columns:
+        df[pto_columns] = df[pto_columns].apply(pd.to_numeric, errors='coerce').fillna(0)
+    return df
+
+ENGINEER_COLUMN_ORDER = ['Team', 'Engineer Name', 'Role', 'Skills', 'Weekly Hours', 'Annual PTO Days']
+
+@st.cache_resource(show_spinner=False)
+def get_engineer_editor_column_config():
+    """Engineer data_editor column settings, built once per server process (Streamlit copies them per call)"""
+    return {
+        "Annual PTO Days": st.column_config.NumberColumn(
+            "Annual PTO Days",
+            help="Auto-calculated sum of monthly PTO days",
+            disabled=True,
+        ),
+        "Engineer Name": st.column_config.TextColumn(
+            "Engineer Name",
+            help="Enter the engineer's name",
+            required=True,
+        ),
+        "Skills": st.column_config.TextColumn(
+            "Skills",
+            help="Enter skills comma-separated (e.g., Python, AWS, React)",
+        ),
+        "Weekly Hours": st.column_config.NumberColumn(
+            "Weekly Hours",
+            help="Weekly working hours",
+            min_value=0,
+            max_value=168,
+            step=1,
+        )
+    }
+
+@functools.lru_cache(maxsize=16)
+def split_pto_columns(columns):
+    """(PTO_ month columns, display columns without them or legacy PTO Days) for a column tuple, once per layout within one run"""
+    pto_columns = tuple(col for col in columns if col.startswith("PTO_"))
+    display_columns = tuple(col for col in columns if not col.startswith("PTO_") and col != "PTO Days")
+    return pto_columns, display_columns
+
+def get_pto_columns(df):
+    """PTO_ month columns of df in column order"""
+    return list(split_pto_columns(tuple(df.columns))[0])
+
+def get_display_columns(df):
+    """Columns of df other than the PTO_ months and the legacy PTO Days column"""
+    return list(split_pto_columns(tuple(df.columns))[1])
+
+PRIORITY_ICONS = {'Critical': '🔴', 'High': '🟠', 'Medium': '🟡', 'Low': '🟢'}
+PRIORITY_LABELS = {priority: f"{icon} {priority}" for priority, icon in PRIORITY_ICONS.items()}
+
+def label_priorities(priorities):
+    """Prefix priorities with their color icon ('⚪' when unknown) in one map instead of a function call per row"""
+    # On the ranked categorical the map only touches the categories; the string fallback is built for unknowns only
+    labels = priorities.map(PRIORITY_LABELS)
+    unknown = labels.isna()
+    if unknown.any():
+        labels = labels.astype(object)
+        labels[unknown] = '⚪ ' + priorities[unknown].astype(str)
+    return labels
+
+def get_valid_engineer_names(engineers_df):
+    """Stripped, non-empty engineer names in row order (vectorized filter)"""
+    names = engineers_df['Engineer Name']
+    names = names[names.notna()].astype(str)
+    stripped = names.str.strip()
+    return stripped[(stripped != '') & (names != 'nan')].tolist()
+
+def find_engineer_index(engineers_df, engineer_name):
+    """Index label of the first row whose stripped Engineer Name matches, or None (one vectorized compare)"""
+    names = engineers_df['Engineer Name'].astype(str).str.strip()
+    matches = np.flatnonzero(names.to_numpy() == str(engineer_name))
+    return engineers_df.index[matches[0]] if len(matches) else None
+
+def build_engineer_rows(engineers_df):
+    """Map each exact Engineer Name string to its first row as a dict (same match as an astype(str) == name filter)"""
+    names = engineers_df['Engineer Name'].astype(str)
+    first_rows = ~names.duplicated()
+    return dict(zip(names[first_rows], engineers_df[first_rows.to_numpy()].to_dict('records')))
+
+def build_pto_matrix(engineers_df, engineer_names, months):
+    """PTO days as an (engineer, month) float matrix - engineers without a row or months without a PTO column read 0"""
+    names = engineers_df['Engineer Name'].astype(str)
+    first_rows = (~names.duplicated()).to_numpy()
+    pto_columns = [f"PTO_{month.replace('-', '_')}" for month in months]
+    # fill_value only applies to missing labels, so blank PTO cells stay NaN like float(row.get(...)) did
+    return (
+        engineers_df[first_rows]
+        .set_index(names[first_rows])
+        .reindex(index=engineer_names, columns=pto_columns, fill_value=0)
+        .to_numpy(dtype=float)
+    )
+
+def build_allocation_matrices(monthly_df, engineer_names, months):
+    """Total allocation and an assigned (1.0/0.0) flag per (engineer, month) - a 0% assignment still counts as assigned"""
+    unique_names = pd.Index(list(dict.fromkeys(engineer_names)))
+    shape = (len(unique_names), len(months))
+    if monthly_df.empty or 'Month' not in monthly_df.columns:
+        return np.zeros((len(engineer_names), len(months))), np.zeros((len(engineer_names), len(months)))
+    
+    # Integer-code each row as an (engineer, month) cell and sum per cell with bincount (-1 = outside the window)
+    engineer_codes = unique_names.get_indexer(monthly_df['Engineer Name'].astype(str))
+    month_codes = pd.Index(months).get_indexer(monthly_df['Month'])
+    rows = unique_names.get_indexer(engineer_names)
+    
+    allocations = np.nan_to_num(monthly_df['Allocation %'].to_numpy(dtype=float))
+    
+    kernel = get_allocation_cells_kernel() if numba_available and len(monthly_df) >= NUMBA_AGGREGATION_MIN_ROWS else None
+    accumulate = kernel if kernel is not None else accumulate_allocation_cells_bincount
+    allocation_matrix, assigned_matrix = accumulate(engineer_codes, month_codes, allocations, shape[0], shape[1])
+    
+    # Expand back to one row per entry of engineer_names (duplicates share a row)
+    return allocation_matrix[rows], assigned_matrix[rows]
+
+def frame_signature(df, columns=None):
+    """Cheap content signature of a DataFrame (columns, length and a digest of the row hashes in row order)"""
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    if df.empty:
+        return (tuple(df.columns), 0, b'')
+    # Digesting the hash array (not its sum) keeps the signature sensitive to row order
+    row_hashes = hash_pandas_object(df, index=False).to_numpy()
+    return (tuple(df.columns), len(df), hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest())
+
+def save_csv(df, csv_path):
+    """Write df as CSV unless the file still holds exactly what the last save_csv call wrote (True when written)"""
+    saved_signatures = st.session_state.setdefault('_saved_csv_signatures', {})
+    signature = frame_signature(df)
+    # The stored mtime guards against skipping a write after the file was changed by anything else
+    if os.path.exists(csv_path) and saved_signatures.get(csv_path) == (os.stat(csv_path).st_mtime_ns, signature):
+        return False
+    df.to_csv(csv_path, index=False)
+    saved_signatures[csv_path] = (os.stat(csv_path).st_mtime_ns, signature)
+    return True
+
+def apply_grid_edits(current_df, grid_df):
+    """Copy only the columns an editor grid changed onto current_df (None when the grid shape or columns differ)"""
+    if grid_df.shape != current_df.shape or list(grid_df.columns) != list(current_df.columns):
+        return None
+    
+    old_values = current_df.to_numpy(dtype=object)
+    new_values = grid_df.to_numpy(dtype=object)
+    changed = (old_values != new_values) & ~(pd.isna(old_values) & pd.isna(new_values))
+    changed_columns = current_df.columns[changed.any(axis=0)]
+    if changed_columns.empty:
+        return current_df
+    
+    # Untouched columns keep their dtypes; changed ones are cast back where the values allow it
+    updated_df = current_df.copy()
+    for col in changed_columns:
+        new_col = grid_df[col]
+        if not isinstance(current_df[col].dtype, pd.CategoricalDtype):
+            try:
+                new_col = new_col.astype(current_df[col].dtype)
+            except (TypeError, ValueError):
+                pass
+        updated_df[col] = new_col.to_numpy()
+    return updated_df
+
+# ─────────────────────────────────────────────────────────────
+# Table Styling Helpers
+# ─────────────────────────────────────────────────────────────
+
+# Percentage columns of the availability summary are kept numeric and formatted at display time
+SUMMARY_PERCENT_FORMAT = {
+    'Current Quarter Utilization': '{:.1f}%',
+    'Current Quarter Availability': '{:.1f}%',
+    'Avg. Quarterly Availability': '{:.1f}%'
+}
+
+def color_status(val):
+    """Background color for an availability status string"""
+    if not isinstance(val, str):
+        val = str(val)
+    if 'Over-allocated' in val:
+        return 'background-color: #FF9999'
+    elif 'Fully occupied' in val:
+        return 'background-color: #FFEB99'
+    else:
+        return 'background-color: #CCFFCC'
+
+def color_availability(val):
+    """Background color for an availability % (numeric values skip string parsing)"""
+    if isinstance(val, str):
+        val = val.replace('%', '')
+    try:
+        val = float(val)
+    except (TypeError, ValueError):
+        return ''
+    if val <= 0:
+        return 'background-color: #FF9999'  # Red for no availability
+    elif val <= 20:
+        return 'background-color: #FFEB99'  # Yellow for low availability
+    else:
+        return 'background-color: #CCFFCC'  # Green for good availability
+
+def color_availability_pivot(pivot):
+    """Cell styles for the whole quarterly availability pivot in one vectorized pass"""
+    values = pivot.to_numpy(dtype=float)
+    styles = np.select(
+        [values <= 0, values <= 20],
+        ['background-color: #FF9999; color: white', 'background-color: #FFEB99'],
+        default='background-color: #CCFFCC'
+    )
+    return pd.DataFrame(styles, index=pivot.index, columns=pivot.columns)
+
+def color_allocation_pivot(pivot):
+    """Cell styles for the whole quarterly allocation pivot in one vectorized pass"""
+    values = pivot.to_numpy(dtype=float)
+    styles = np.select(
+        [values >= 100, values >= 80],
+        ['background-color: #FF9999; color: white', 'background-color: #FFEB99'],
+        default='background-color: #CCFFCC'
+    )
+    return pd.DataFrame(styles, index=pivot.index, columns=pivot.columns)
+
+# ─────────────────────────────────────────────────────────────
+# Data Loading Helpers
+# ─────────────────────────────────────────────────────────────
+
+FUTURE_STRING_COLUMNS = ['Project Name', 'Required Skills', 'Priority', 'Status', 'Notes']
+FUTURE_PRIORITY_LEVELS = ['', 'Low', 'Medium', 'High', 'Critical']
+
+@st.cache_data(show_spinner=False)
+def load_csv_for_mtime(path, mtime):
+    """Parse a CSV once per (path, modification time); reruns get a cached copy"""
+    return pd.read_csv(path)
+
+def read_csv_cached(path):
+    """Read a CSV, re-parsing only when the file has changed on disk"""
+    return load_csv_for_mtime(path, os.stat(path).st_mtime_ns)
+
+@st.cache_data(show_spinner=False)
+def load_future_projects_for_mtime(path, mtime):
+    """Parse future projects and coerce its string columns once per file version"""
+    loaded_future_df = pd.read_csv(path)
+    # One fillna and one astype over all string columns instead of a column-by-column setitem
+    string_columns = loaded_future_df.columns.intersection(FUTURE_STRING_COLUMNS)
+    if len(string_columns):
+        loaded_future_df = (
+            loaded_future_df
+            .fillna({col: '' for col in string_columns})
+            .astype({col: str for col in string_columns})
+        )
+    return loaded_future_df
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_engineers_for_mtime(path, mtime, monthly_path, monthly_mtime, today):
+    """Parse and upgrade the engineers CSV once per file version, assignments version and day
+    
+    Returns (engineers_df, legacy_pto_removed, pto_columns_added); the caller persists the frame
+    when either flag is set, which changes mtime so the next rerun loads the upgraded file.
+    """
+    loaded_df = pd.read_csv(path)
+    # Remove old PTO Days column if it exists (legacy cleanup)
+    legacy_pto_removed = 'PTO Days' in loaded_df.columns
+    if legacy_pto_removed:
+        loaded_df = loaded_df.drop(columns=['PTO Days'])
+    # Clean up Engineer Name column - convert to string, handle NaN, and strip whitespace
+    normalize_engineer_names(loaded_df)
+    # Remove rows without an engineer name (names are already normalized, so no full-frame cast is needed)
+    loaded_df = loaded_df[loaded_df['Engineer Name'] != '']
+    
+    # Ensure all required columns exist
+    if "Team" not in loaded_df.columns:
+        loaded_df["Team"] = ""
+    if "Annual PTO Days" not in loaded_df.columns:
+        loaded_df["Annual PTO Days"] = 0
+    if "Notes" not in loaded_df.columns:
+        loaded_df["Notes"] = ""
+    if "Role" not in loaded_df.columns:
+        loaded_df["Role"] = ""
+    if "Skills" not in loaded_df.columns:
+        loaded_df["Skills"] = ""
+    if "Weekly Hours" not in loaded_df.columns:
+        loaded_df["Weekly Hours"] = 40
+    
+    # Add monthly PTO columns if they don't exist, starting with the next 12 months from current date
+    month_keys = get_next_months(12, today, date_format="PTO_%Y_%m")
+    
+    # Check for any existing monthly assignments and add PTO columns for those months
+    try:
+        if monthly_mtime is not None:
+            # Only the Month column is needed here, so skip tokenizing and converting the other fields
+            temp_monthly = pd.read_csv(monthly_path, usecols=lambda column: column == 'Month')
+            if not temp_monthly.empty and 'Month' in temp_monthly.columns:
+                for month in temp_monthly['Month'].unique():
+                    month_keys.append(f"PTO_{month.replace('-', '_')}")
+    except:
+        pass
+    
+    loaded_df, added_keys = add_missing_pto_columns(loaded_df, month_keys)
+    pto_columns_added = bool(added_keys)
+    
+    # Recalculate Annual PTO Days
+    pto_columns = get_pto_columns(loaded_df)
+    if pto_columns:
+        # Ensure all PTO values are numeric
+        coerce_pto_columns(loaded_df, pto_columns)
+        loaded_df['Annual PTO Days'] = loaded_df[pto_columns].sum(axis=1)
+    
+    return loaded_df, legacy_pto_removed, pto_columns_added
+
+@st.cache_data(show_spinner=False)
+def load_monthly_assignments_for_mtime(path, mtime):
+    """Parse and normalize monthly assignments once per file version; returns (df, priority_added)"""
+    loaded_monthly_df = pd.read_csv(path)
+    # Ensure Engineer Name is string type and stripped
+    normalize_engineer_names(loaded_monthly_df)
+    # Ensure Allocation % is numeric
+    if 'Allocation %' in loaded_monthly_df.columns:
+        loaded_monthly_df['Allocation %'] = pd.to_numeric(loaded_monthly_df['Allocation %'], errors='coerce').fillna(0)
+    # Add Program column if it doesn't exist
+    if 'Program' not in loaded_monthly_df.columns:
+        loaded_monthly_df['Program'] = 'Default Program'
+    # Add Priority column if it doesn't exist
+    priority_added = 'Priority' not in loaded_monthly_df.columns
+    if priority_added:
+        loaded_monthly_df['Priority'] = 'Medium'
+    # Blank priorities default to Medium like a missing column; rank order makes sort_values(['Priority', ...]) Critical-first
+    categorize_assignment_priority(loaded_monthly_df)
+    return loaded_monthly_df, priority_added
+
+@st.cache_data(show_spinner=False)
+def load_feather_for_mtime(path, mtime):
+    """Read a Feather file once per modification time (Arrow round-trips the column dtypes)"""
+    return pd.read_feather(path)
+
+def categorize_future_priority(df):
+    """Store Priority as a categorical so comparisons run on integer codes (unknown values become extra categories)"""
+    if 'Priority' not in df.columns or isinstance(df['Priority'].dtype, pd.CategoricalDtype):
+        return df
+    priority = df['Priority'].fillna('').astype(str)
+    extra_levels = sorted(set(priority.unique()) - set(FUTURE_PRIORITY_LEVELS))
+    df['Priority'] = priority.astype(pd.CategoricalDtype(FUTURE_PRIORITY_LEVELS + extra_levels))
+    return df
+
+ASSIGNMENT_PRIORITY_LEVELS = ['Critical', 'High', 'Medium', 'Low']
+
+def categorize_assignment_priority(df):
+    """Store assignment Priority as an ordered categorical so sorts run on rank codes (unknown values rank last)"""
+    if 'Priority' not in df.columns or isinstance(df['Priority'].dtype, pd.CategoricalDtype):
+        return df
+    priority = df['Priority'].fillna('Medium').astype(str)
+    extra_levels = sorted(set(priority.unique()) - set(ASSIGNMENT_PRIORITY_LEVELS))
+    df['Priority'] = priority.astype(pd.CategoricalDtype(ASSIGNMENT_PRIORITY_LEVELS + extra_levels, ordered=True))
+    return df
+
+def high_priority_mask(priorities):
+    """Boolean mask of Critical/High priorities (one int8 code compare when Priority is the ranked categorical)"""
+    if isinstance(priorities.dtype, pd.CategoricalDtype) and list(priorities.cat.categories[:2]) == ASSIGNMENT_PRIORITY_LEVELS[:2]:
+        codes = priorities.cat.codes
+        return (codes >= 0) & (codes < 2)
+    return priorities.isin(ASSIGNMENT_PRIORITY_LEVELS[:2])
+
+ASSIGNMENT_LABEL_COLUMNS = ['Engineer Name', 'Program', 'Feature', 'Month', 'Priority']
+
+def categorize_assignment_labels(df):
+    """Store repeated assignment labels as categoricals on read-only analytics copies (group them with observed=True)"""
+    for column in ASSIGNMENT_LABEL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+def top_category_labels(labels, weights, k):
+    """Categorical labels with the k largest weight totals, in category order (ties keep the first, like nlargest)"""
+    codes = labels.cat.codes.to_numpy()
+    observed = codes >= 0
+    n_categories = len(labels.cat.categories)
+    # Integer-label accumulation on the category codes instead of a groupby + full sort
+    totals = np.bincount(codes[observed], weights=np.nan_to_num(weights.to_numpy(dtype=float)[observed]), minlength=n_categories)
+    positions = np.flatnonzero(np.bincount(codes[observed], minlength=n_categories) > 0)
+    totals = totals[positions]
+    if len(positions) > k:
+        # Partial top-k: everything above the k-th largest total, then the first ties at that total
+        threshold = np.partition(totals, len(totals) - k)[len(totals) - k]
+        keep = totals > threshold
+        keep[np.flatnonzero(totals == threshold)[:k - keep.sum()]] = True
+        positions = positions[keep]
+    return labels.cat.categories[positions].tolist()
+
+def future_projects_store(csv_path):
+    """Storage file for future projects: a Feather sibling of the CSV when pyarrow is available"""
+    if pyarrow_available:
+        return os.path.splitext(csv_path)[0] + ".feather"
+    return csv_path
+
+def save_future_projects(df, csv_path):
+    """Persist future projects as Feather when pyarrow is available, otherwise as CSV"""
+    if not pyarrow_available:
+        df.to_csv(csv_path, index=False)
+        return
+    
+    out = df.reset_index(drop=True)
+    # Arrow needs one type per column, so stringify object columns that mix numbers and text
+    mixed_columns = {
+        col: str for col in out.columns
+        if out[col].dtype == object
+        and pd.api.types.infer_dtype(out[col], skipna=True) in ('mixed', 'mixed-integer')
+    }
+    if mixed_columns:
+        out = out.astype(mixed_columns)
+    out.to_feather(future_projects_store(csv_path))
+
+def flush_future_projects(df, csv_path, force=False):
+    """Write future projects when changes are pending (or when forced) and clear the dirty flag"""
+    if not force and not st.session_state.get('future_dirty', False):
+        return False
+    save_future_projects(df, csv_path)
+    st.session_state.future_dirty = False
+    return True
+
+def load_future_projects(csv_path):
+    """Load future projects, migrating a legacy CSV to Feather the first time it is read"""
+    store_path = future_projects_store(csv_path)
+    if store_path != csv_path and os.path.exists(store_path):
+        return load_feather_for_mtime(store_path, os.stat(store_path).st_mtime_ns)
+    
+    # CSV path (no pyarrow, or not migrated yet) - string columns are coerced in the cached loader
+    loaded_future_df = load_future_projects_for_mtime(csv_path, os.stat(csv_path).st_mtime_ns)
+    if store_path != csv_path:
+        save_future_projects(loaded_future_df, csv_path)
+    return loaded_future_df
 
 # ─────────────────────────────────────────────────────────────
 # 1) Default Data Constructors
@@ -283,11 +813,8 @@ def sort_quarters_chronologically(quarters):
 
 def default_engineers():
     # Generate month columns for the next 12 months
-    current_date = datetime.now()
     month_columns = {}
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        month_key = f"PTO_{month_date.strftime('%Y_%m')}"
+    for month_key in get_next_months(12, date_format="PTO_%Y_%m"):
         month_columns[month_key] = [0, 0]  # Default 0 PTO days for each engineer
     
     base_data = {
@@ -317,12 +844,6 @@ def default_future_projects():
 
 def default_monthly_assignments():
     """Default monthly assignments structure with Program and Priority fields"""
-    current_date = datetime.now()
-    months = []
-    for i in range(6):  # Default to 6 months ahead
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
-    
     return pd.DataFrame({
         "Engineer Name": [],
         "Program": [],
@@ -337,14 +858,12 @@ def default_monthly_assignments():
 # 2) Monthly Assignment Functions
 # ─────────────────────────────────────────────────────────────
 
-def generate_monthly_utilization_chart(monthly_df, engineers_df):
-    """Generate a quarterly summary of engineer utilization"""
+@st.cache_data(show_spinner=False, max_entries=16)
+def generate_monthly_utilization_chart(monthly_df, engineers_df, today):
+    """Generate a quarterly summary of engineer utilization (today is "YYYY-MM-DD", part of the cache key)"""
     
-    # Get all engineers with valid names, handling different data types
-    all_engineers = []
-    for name in engineers_df['Engineer Name'].tolist():
-        if name is not None and str(name).strip() and str(name) != 'nan':
-            all_engineers.append(str(name).strip())
+    # Get all engineers with valid names
+    all_engineers = get_valid_engineer_names(engineers_df)
     
     # If no engineers, return empty dataframe with expected columns
     if not all_engineers:
@@ -355,23 +874,66 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
         return empty_summary, empty_details
     
     # Generate default months if no data - always show next 12 months (4 quarters)
-    current_date = datetime.now()
-    months = []
-    for i in range(12):  # Show 12 months = 4 quarters
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
+    months = get_next_months(12, today)
     
     # Group months by quarter
-    quarters_dict = {}
-    for month in months:
-        quarter = get_fiscal_quarter(month)
-        if quarter not in quarters_dict:
-            quarters_dict[quarter] = []
-        quarters_dict[quarter].append(month)
+    quarters_dict = group_months_by_quarter(months)
     
     # Sort quarters chronologically
     sorted_quarters = sort_quarters_chronologically(list(quarters_dict.keys()))
     
+    # Look up engineer rows once instead of filtering engineers_df per engineer
+    engineer_rows = build_engineer_rows(engineers_df)
+    
+    # PTO and working days for every (engineer, month) of the window, computed as whole matrices and summed
+    # per quarter with reduceat; fmax keeps max(0, nan) == 0 so a blank PTO cell still gives 0 working days
+    unique_engineers = list(dict.fromkeys(all_engineers))
+    window_quarters, quarter_starts = get_quarter_runs(months)
+    quarter_positions = {quarter: position for position, quarter in enumerate(window_quarters)}
+    pto_matrix = build_pto_matrix(engineers_df, unique_engineers, months)
+    working_days_matrix = np.fmax(0.0, 22 - pto_matrix)
+    pto_by_engineer = dict(zip(unique_engineers, np.add.reduceat(pto_matrix, quarter_starts, axis=1).tolist()))
+    working_days_by_engineer = dict(zip(
+        unique_engineers, np.add.reduceat(working_days_matrix, quarter_starts, axis=1).tolist()
+    ))
+    
+    # Positive allocations per (engineer, month) and per-feature totals per (engineer, quarter), summed with
+    # groupby over the window rows (in month order) instead of filtering monthly_df per engineer and month
+    quarter_of_month = {month: quarter for quarter, quarter_months in quarters_dict.items() for month in quarter_months}
+    month_totals = {}
+    quarter_features = {}
+    if not monthly_df.empty and 'Month' in monthly_df.columns:
+        window_rows = monthly_df[monthly_df['Month'].isin(months)].sort_values('Month', kind='stable')
+        allocations = pd.to_numeric(window_rows['Allocation %'], errors='coerce').astype(float)
+        positive_rows = pd.DataFrame({
+            'Engineer Name': window_rows['Engineer Name'].astype(str),
+            'Month': window_rows['Month'],
+            'Quarter': window_rows['Month'].map(quarter_of_month),
+            'Feature': window_rows['Feature'],
+            'Allocation %': allocations
+        })[allocations > 0]
+        
+        month_sums = positive_rows.groupby(['Engineer Name', 'Month'], sort=False)['Allocation %'].sum()
+        month_totals = dict(zip(month_sums.index, month_sums.tolist()))
+        feature_sums = positive_rows.groupby(
+            ['Engineer Name', 'Quarter', 'Feature'], sort=False, dropna=False
+        )['Allocation %'].sum()
+        for (engineer_name, quarter, feature_name), allocation in zip(feature_sums.index, feature_sums.tolist()):
+            quarter_features.setdefault((engineer_name, quarter), {})[feature_name] = allocation
+    
+    # Roll the monthly totals (in month order) up to quarters, then format each (engineer, quarter)
+    # feature list once (average per month with assignment)
+    quarter_allocations = {}
+    months_with_assignments = {}
+    for (engineer_name, month), month_total_allocation in month_totals.items():
+        key = (engineer_name, quarter_of_month[month])
+        quarter_allocations[key] = quarter_allocations.get(key, 0) + month_total_allocation
+        months_with_assignments[key] = months_with_assignments.get(key, 0) + 1
+    features_text = {
+        key: ', '.join(f"{feat} ({features[feat]/months_with_assignments[key]:.1f}%)" for feat in sorted(features))
+        for key, features in quarter_features.items()
+    }
+    
     # Create utilization data by quarter
     utilization_data = []
     availability_details = []
@@ -383,63 +945,12 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
             # Ensure string comparison
             engineer_str = str(engineer)
             
-            # Initialize quarterly tracking
-            total_allocation = 0
-            total_effective_allocation = 0
-            total_pto_days = 0
-            total_working_days = 0
-            all_features = {}
-            months_with_data = 0
-            
-            # Calculate for each month in the quarter
-            for month in quarter_months:
-                # Filter monthly data for this specific month
-                if not monthly_df.empty and 'Month' in monthly_df.columns:
-                    month_data = monthly_df[monthly_df['Month'] == month]
-                else:
-                    month_data = pd.DataFrame()
-                
-                # Get PTO days for this specific month
-                pto_days = 0
-                working_days_in_month = 22  # Typical working days in a month
-                
-                engineer_matches = engineers_df[engineers_df['Engineer Name'].astype(str) == engineer_str]
-                
-                if not engineer_matches.empty:
-                    engineer_row = engineer_matches.iloc[0]
-                    month_pto_key = f"PTO_{month.replace('-', '_')}"
-                    
-                    if month_pto_key in engineers_df.columns:
-                        pto_days = float(engineer_row.get(month_pto_key, 0))
-                
-                # Calculate working days
-                effective_working_days = max(0, working_days_in_month - pto_days)
-                
-                # Calculate allocation for this month
-                month_total_allocation = 0
-                if not month_data.empty:
-                    engineer_month_data = month_data[month_data['Engineer Name'].astype(str) == engineer_str]
-                    
-                    for _, row in engineer_month_data.iterrows():
-                        try:
-                            allocation = float(row['Allocation %'])
-                            if allocation > 0:
-                                month_total_allocation += allocation
-                                feature_name = row['Feature']
-                                if feature_name in all_features:
-                                    all_features[feature_name] += allocation
-                                else:
-                                    all_features[feature_name] = allocation
-                        except:
-                            pass
-                
-                # Add to total only if there's an assignment
-                if month_total_allocation > 0:
-                    total_allocation += month_total_allocation
-                    months_with_data += 1
-                
-                total_pto_days += pto_days
-                total_working_days += effective_working_days
+            # Quarterly totals: PTO and working days (22 per month less PTO), and allocation over months with assignments
+            total_pto_days = pto_by_engineer[engineer_str][quarter_positions[quarter]]
+            total_working_days = working_days_by_engineer[engineer_str][quarter_positions[quarter]]
+            total_allocation = quarter_allocations.get((engineer_str, quarter), 0)
+            months_with_data = months_with_assignments.get((engineer_str, quarter), 0)
+            all_features = quarter_features.get((engineer_str, quarter), {})
             
             # Calculate quarterly averages
             if months_with_data > 0:
@@ -454,9 +965,6 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
                 # Available capacity considers both allocation and PTO impact
                 effective_capacity = 100 * avg_working_days_ratio
                 available_capacity = max(0, effective_capacity - effective_allocation)
-                
-                # Format features for display (showing average per month with assignment)
-                features_list = [f"{feat} ({all_features[feat]/months_with_data:.1f}%)" for feat in sorted(all_features.keys())]
             else:
                 # No assignments in quarter
                 avg_allocation = 0
@@ -465,7 +973,6 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
                 avg_working_days_ratio = avg_working_days / 22 if avg_working_days > 0 else 1
                 effective_allocation = 0
                 available_capacity = 100 * avg_working_days_ratio
-                features_list = []
             
             utilization_data.append({
                 'Engineer': engineer,
@@ -474,7 +981,7 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
                 'Effective Allocation': effective_allocation,
                 'Available Capacity': available_capacity,
                 'PTO Impact': (1 - avg_working_days_ratio) * 100 if months_with_data > 0 else 0,
-                'Features': ', '.join(features_list) if features_list else 'None',
+                'Features': features_text.get((engineer_str, quarter), 'None'),
                 'Working Days': total_working_days,
                 'PTO Days': total_pto_days,
                 'Status': 'Over-allocated' if effective_allocation > 100 else 
@@ -528,24 +1035,23 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
             
             # Get annual PTO
             annual_pto = 0
-            engineer_matches = engineers_df[engineers_df['Engineer Name'].astype(str) == engineer]
-            if not engineer_matches.empty:
-                annual_pto = engineer_matches['Annual PTO Days'].iloc[0]
+            if engineer in engineer_rows:
+                annual_pto = engineer_rows[engineer]['Annual PTO Days']
             
             availability_summary.append({
                 'Engineer': engineer,
-                'Current Quarter Utilization': f"{current_data['Effective Allocation']:.1f}%",
-                'Current Quarter Availability': f"{current_data['Available Capacity']:.1f}%",
-                'Avg. Quarterly Availability': f"{avg_availability:.1f}%",
+                'Current Quarter Utilization': round(current_data['Effective Allocation'], 1),
+                'Current Quarter Availability': round(current_data['Available Capacity'], 1),
+                'Avg. Quarterly Availability': round(avg_availability, 1),
                 'Annual PTO Days': annual_pto,
                 'Status': status
             })
         else:
             availability_summary.append({
                 'Engineer': engineer,
-                'Current Quarter Utilization': "0.0%",
-                'Current Quarter Availability': "100.0%",
-                'Avg. Quarterly Availability': "100.0%",
+                'Current Quarter Utilization': 0.0,
+                'Current Quarter Availability': 100.0,
+                'Avg. Quarterly Availability': 100.0,
                 'Annual PTO Days': 0,
                 'Status': "Fully available"
             })
@@ -562,119 +1068,64 @@ def generate_monthly_utilization_chart(monthly_df, engineers_df):
     
     return summary_df, availability_df
 
-def generate_quarterly_availability_chart(monthly_df, engineers_df, show_allocation=False):
+def get_utilization_summary(monthly_df, engineers_df):
+    """Cached generate_monthly_utilization_chart over just the columns it reads, keeping the cache key cheap to hash"""
+    monthly_columns = [col for col in ['Engineer Name', 'Month', 'Feature', 'Allocation %'] if col in monthly_df.columns]
+    engineer_columns = [col for col in engineers_df.columns if col in ('Engineer Name', 'Annual PTO Days') or col.startswith("PTO_")]
+    return generate_monthly_utilization_chart(
+        monthly_df[monthly_columns],
+        engineers_df[engineer_columns],
+        datetime.now().strftime("%Y-%m-%d")  # The 12-month window moves with the current date
+    )
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def generate_quarterly_availability_chart(monthly_df, engineers_df, today, show_allocation=False):
     """Generate quarterly bandwidth availability or allocation chart per engineer
     
     Args:
         monthly_df: Monthly assignments dataframe
         engineers_df: Engineers dataframe
+        today: Current date as "YYYY-MM-DD"; the 12-month window starts here and it keys the cache
         show_allocation: If True, show allocation %; if False, show availability %
     """
     
-    # Get all valid engineers
-    all_engineers = []
-    for name in engineers_df['Engineer Name'].tolist():
-        if name is not None and str(name).strip() and str(name) != 'nan':
-            all_engineers.append(str(name).strip())
+    # Get all engineers with valid names
+    all_engineers = get_valid_engineer_names(engineers_df)
     
     if not all_engineers:
         return None
     
     # Generate months for next 12 months
-    current_date = datetime.now()
-    months = []
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
-    
-    # Calculate quarterly data
-    quarterly_data = []
-    
-    # Group months by quarter
-    quarters = {}
-    for month in months:
-        quarter = get_fiscal_quarter(month)
-        if quarter not in quarters:
-            quarters[quarter] = []
-        quarters[quarter].append(month)
-    
-    for quarter, quarter_months in quarters.items():
-        for engineer in all_engineers:
-            total_allocation = 0
-            total_effective_allocation = 0
-            total_working_days = 0
-            total_pto_days = 0
-            months_with_assignments = 0
-            
-            for month in quarter_months:
-                # Get allocations for this month
-                month_allocation = 0
-                has_assignment = False
-                
-                if not monthly_df.empty and 'Month' in monthly_df.columns:
-                    month_data = monthly_df[(monthly_df['Month'] == month) & 
-                                          (monthly_df['Engineer Name'].astype(str) == str(engineer))]
-                    if not month_data.empty:
-                        month_allocation = month_data['Allocation %'].sum()
-                        has_assignment = True
-                        months_with_assignments += 1
-                
-                # Get PTO days
-                pto_days = 0
-                working_days_in_month = 22
-                
-                engineer_matches = engineers_df[engineers_df['Engineer Name'].astype(str) == str(engineer)]
-                if not engineer_matches.empty:
-                    engineer_row = engineer_matches.iloc[0]
-                    month_pto_key = f"PTO_{month.replace('-', '_')}"
-                    if month_pto_key in engineers_df.columns:
-                        pto_days = float(engineer_row.get(month_pto_key, 0))
-                
-                effective_working_days = max(0, working_days_in_month - pto_days)
-                working_days_ratio = effective_working_days / working_days_in_month if working_days_in_month > 0 else 1
-                
-                # Only accumulate if there's assignment
-                if has_assignment:
-                    total_allocation += month_allocation
-                    # FIXED: Don't inflate allocation based on PTO - allocation stays the same
-                    total_effective_allocation += month_allocation
-                
-                total_working_days += effective_working_days
-                total_pto_days += pto_days
-            
-            # Calculate averages correctly
-            if months_with_assignments > 0:
-                # Average allocation only over months with assignments
-                avg_allocated = total_allocation / months_with_assignments
-                avg_effective_allocated = total_effective_allocation / months_with_assignments
-            else:
-                # No assignments in this quarter
-                avg_allocated = 0
-                avg_effective_allocated = 0
-            
-            # Calculate availability - Cap at 100%
-            # For availability calculation, we need to consider PTO impact
-            # If someone has PTO, their effective availability is reduced
-            if months_with_assignments > 0 or total_pto_days > 0:
-                avg_working_days_ratio = total_working_days / (len(quarter_months) * 22)
-                # Availability is reduced by both allocation and PTO
-                effective_capacity = 100 * avg_working_days_ratio
-                avg_available = min(100, max(0, effective_capacity - avg_effective_allocated))
-            else:
-                avg_available = min(100, max(0, 100 - avg_effective_allocated))
-            
-            quarterly_data.append({
-                'Engineer': engineer,
-                'Quarter': quarter,
-                'Avg Available %': round(avg_available, 1),
-                'Avg Allocated %': round(avg_effective_allocated, 1),
-                'Total PTO Days': round(total_pto_days, 1)
-            })
-    
-    if not quarterly_data:
-        return None
-    
-    quarterly_df = pd.DataFrame(quarterly_data)
+    months = get_next_months(12, today)
+    
+    # (engineer x month) matrices for the window, one row per entry of all_engineers; fmax keeps
+    # max(0, nan) == 0 so a blank PTO cell still gives 0 working days
+    quarters, quarter_starts = get_quarter_runs(months)
+    allocation_matrix, assigned_matrix = build_allocation_matrices(monthly_df, all_engineers, months)
+    pto_matrix = build_pto_matrix(engineers_df, all_engineers, months)
+    working_days_matrix = np.fmax(0.0, 22 - pto_matrix)
+    
+    # Per-quarter sums (engineer x quarter); allocation is averaged over assigned months only and
+    # is not inflated by PTO
+    months_in_quarter = np.diff(np.append(quarter_starts, len(months)))
+    assigned_months = np.add.reduceat(assigned_matrix, quarter_starts, axis=1)
+    total_pto_days = np.add.reduceat(pto_matrix, quarter_starts, axis=1)
+    total_working_days = np.add.reduceat(working_days_matrix, quarter_starts, axis=1)
+    avg_allocated = average_quarter_allocations(allocation_matrix, assigned_matrix, quarter_starts)
+    
+    # Availability is reduced by both allocation and PTO once either applies, capped to 0-100%
+    effective_capacity = 100 * total_working_days / (months_in_quarter * 22)
+    capacity = np.where((assigned_months > 0) | (total_pto_days > 0), effective_capacity, 100)
+    avg_available = np.clip(capacity - avg_allocated, 0, 100)
+    
+    # One row per (quarter, engineer), quarter-major like the per-engineer loop produced
+    quarterly_df = pd.DataFrame({
+        'Engineer': np.tile(np.array(all_engineers, dtype=object), len(quarters)),
+        'Quarter': np.repeat(np.array(quarters, dtype=object), len(all_engineers)),
+        'Avg Available %': [round(value, 1) for value in avg_available.T.ravel().tolist()],
+        'Avg Allocated %': [round(value, 1) for value in avg_allocated.T.ravel().tolist()],
+        'Total PTO Days': [round(value, 1) for value in total_pto_days.T.ravel().tolist()]
+    })
     
     # Get all unique engineers
     all_engineers_sorted = sorted(all_engineers)
@@ -687,16 +1138,12 @@ def generate_quarterly_availability_chart(monthly_df, engineers_df, show_allocat
     
     # If too many engineers, use a heatmap
     if num_engineers > 15:
-        # Create pivot table for heatmap
-        pivot_data = quarterly_df.pivot(
-            index='Engineer',
-            columns='Quarter',
-            values=value_column
-        )
+        # Create pivot table for heatmap (one reshape; duplicate engineer names raise, like pivot)
+        pivot_data = quarterly_df.set_index(['Engineer', 'Quarter'])[value_column].unstack('Quarter')
         
         # Sort columns chronologically
-        sorted_columns = sort_quarters_chronologically(pivot_data.columns.tolist())
-        pivot_data = pivot_data[sorted_columns]
+        sorted_columns = sort_quarters_chronologically(list(pivot_data.columns))
+        pivot_data = pivot_data.reindex(columns=sorted_columns)
         
         # Choose appropriate colorscale based on what we're showing
         if show_allocation:
@@ -709,8 +1156,8 @@ def generate_quarterly_availability_chart(monthly_df, engineers_df, show_allocat
             z=pivot_data.values,
             x=sorted_columns,
             y=pivot_data.index.tolist(),
-            text=pivot_data.values,
-            texttemplate='%{text:.1f}%',
+            # Cell labels format z in the browser, so the values are not sent a second time as text
+            texttemplate='%{z:.1f}%',
             textfont={"size": 10},
             colorscale=colorscale,
             colorbar=dict(
@@ -733,18 +1180,20 @@ def generate_quarterly_availability_chart(monthly_df, engineers_df, show_allocat
         # Sort quarters for proper display
         sorted_quarters = sort_quarters_chronologically(quarterly_df['Quarter'].unique())
         
-        for engineer in all_engineers_sorted:
-            engineer_data = quarterly_df[quarterly_df['Engineer'] == engineer]
-            
-            # Prepare data for all quarters (fill missing with appropriate default)
-            y_values = []
-            for q in sorted_quarters:
-                q_data = engineer_data[engineer_data['Quarter'] == q]
-                if not q_data.empty:
-                    y_values.append(q_data[value_column].iloc[0])
-                else:
-                    # Default to 100% available or 0% allocated if no data
-                    y_values.append(0 if show_allocation else 100)
+        # Engineer x Quarter grid of the first value per pair, reshaped once instead of filtering per bar;
+        # missing quarters default to 100% available or 0% allocated
+        values_by_engineer = (
+            quarterly_df.drop_duplicates(['Engineer', 'Quarter'])
+            .set_index(['Engineer', 'Quarter'])[value_column]
+            .unstack('Quarter')
+            .reindex(index=all_engineers_sorted, columns=sorted_quarters)
+            .fillna(0 if show_allocation else 100)
+            .to_numpy()
+        )
+        
+        # Rows are aligned to the trace order above, so each bar reads its row by position
+        for engineer, engineer_values in zip(all_engineers_sorted, values_by_engineer):
+            y_values = engineer_values.tolist()
             
             fig.add_trace(go.Bar(
                 name=engineer,
@@ -784,30 +1233,45 @@ def generate_quarterly_utilization_charts(monthly_df, engineers_df):
 
 def create_monthly_assignment_matrix(engineers_df, features, num_months=6):
     """Create a matrix view for monthly assignments"""
-    current_date = datetime.now()
-    months = []
-    
-    for i in range(num_months):
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
-    
-    # Create a matrix dataframe
-    matrix_data = []
+    months = get_next_months(num_months)
     
     # Get valid engineer names
-    valid_engineers = []
-    for name in engineers_df['Engineer Name']:
-        if name is not None and str(name).strip() and str(name) != 'nan':
-            valid_engineers.append(str(name))
+    valid_engineers = get_valid_engineer_names(engineers_df)
     
-    for engineer in valid_engineers:
-        for feature in features:
-            row = {'Engineer': engineer, 'Feature': feature}
-            for month in months:
-                row[month] = 0  # Default allocation
-            matrix_data.append(row)
+    # One row per (engineer, feature) pair with a zero default allocation per month, built in one constructor
+    pairs = pd.MultiIndex.from_product([valid_engineers, list(features)], names=['Engineer', 'Feature'])
+    matrix_df = pd.DataFrame(0, index=pairs, columns=months).reset_index()
     
-    return pd.DataFrame(matrix_data), months
+    return matrix_df, months
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_engineer_assignment_view(monthly_df, engineer):
+    """Display rows and quick stats for one engineer's assignments, reused until the frame or engineer changes"""
+    # Look up the engineer's rows through the hash-built group index instead of a full-column compare
+    assignment_groups = monthly_df.groupby('Engineer Name', sort=False)
+    if engineer not in assignment_groups.groups:
+        return None, None
+    engineer_assignments = assignment_groups.get_group(engineer).sort_values(['Priority', 'Month'])
+    
+    # Create a formatted version for display
+    display_df = engineer_assignments.copy()
+    display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
+    
+    # Add priority color coding
+    if 'Priority' in display_df.columns:
+        display_df['Priority'] = label_priorities(display_df['Priority'])
+    
+    stats = {
+        'total_assignments': len(engineer_assignments),
+        'unique_features': engineer_assignments['Feature'].nunique(),
+        'avg_allocation': engineer_assignments['Allocation %'].mean(),
+        # Count critical/high priority items
+        'critical_high': (
+            int(high_priority_mask(engineer_assignments['Priority']).sum())
+            if 'Priority' in engineer_assignments.columns else None
+        ),
+    }
+    return display_df[['Priority', 'Program', 'Feature', 'Month', 'Allocation %', 'Notes']], stats
 
 def generate_program_feature_quarterly_trends(monthly_df):
     """Generate quarterly trend charts for programs and features"""
@@ -816,11 +1280,7 @@ def generate_program_feature_quarterly_trends(monthly_df):
         return None, None
     
     # Generate months for next 12 months
-    current_date = datetime.now()
-    months = []
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        months.append(month_date.strftime("%Y-%m"))
+    months = get_next_months(12)
     
     # Filter monthly_df to only include these months
     monthly_df_filtered = monthly_df[monthly_df['Month'].isin(months)]
@@ -828,27 +1288,28 @@ def generate_program_feature_quarterly_trends(monthly_df):
     if monthly_df_filtered.empty:
         return None, None
     
-    # Add Quarter column
-    monthly_df_filtered['Quarter'] = monthly_df_filtered['Month'].apply(get_fiscal_quarter)
+    # Add Quarter column by mapping the 12 window months instead of parsing every row; assign() returns
+    # a new frame, so the categorical conversion below never writes into a slice of monthly_df
+    month_quarters = dict(zip(months, get_fiscal_quarter_series(pd.Series(months))))
+    monthly_df_filtered = monthly_df_filtered.assign(Quarter=monthly_df_filtered['Month'].map(month_quarters))
+    categorize_assignment_labels(monthly_df_filtered)
     
     # 1. Program trend over quarters
     if 'Program' in monthly_df_filtered.columns:
-        program_quarterly = monthly_df_filtered.groupby(['Quarter', 'Program'])['Allocation %'].sum().reset_index()
-        # Calculate average per month in quarter (divide by 3 months)
-        program_quarterly['Allocation %'] = program_quarterly['Allocation %'] / 3
-        
-        # Create pivot for line chart
-        program_pivot = program_quarterly.pivot(index='Quarter', columns='Program', values='Allocation %').fillna(0)
+        # Average per month in quarter (divide by 3 months), pivoted straight from the groupby result for the line chart
+        program_pivot = (
+            monthly_df_filtered.groupby(['Quarter', 'Program'], observed=True)['Allocation %'].sum()
+            .div(3)
+            .unstack('Program', fill_value=0)
+        )
         
         # Sort quarters chronologically
         sorted_quarters = sort_quarters_chronologically(program_pivot.index.tolist())
         program_pivot = program_pivot.reindex(sorted_quarters)
         
-        # Create line chart
-        fig_program_trend = go.Figure()
-        
-        for program in program_pivot.columns:
-            fig_program_trend.add_trace(go.Scatter(
+        # Create line chart, handing every trace to the figure in one call instead of add_trace per line
+        fig_program_trend = go.Figure(data=[
+            go.Scatter(
                 x=program_pivot.index,
                 y=program_pivot[program],
                 mode='lines+markers',
@@ -856,7 +1317,9 @@ def generate_program_feature_quarterly_trends(monthly_df):
                 line=dict(width=3),
                 marker=dict(size=10),
                 hovertemplate='%{x}<br>%{y:.1f}%<br>Program: ' + program + '<extra></extra>'
-            ))
+            )
+            for program in program_pivot.columns
+        ])
         
         fig_program_trend.update_layout(
             title="Quarterly Program Allocation Trends",
@@ -869,26 +1332,23 @@ def generate_program_feature_quarterly_trends(monthly_df):
         fig_program_trend = None
     
     # 2. Top features trend over quarters
-    feature_quarterly = monthly_df_filtered.groupby(['Quarter', 'Feature'])['Allocation %'].sum().reset_index()
     # Calculate average per month in quarter (divide by 3 months)
-    feature_quarterly['Allocation %'] = feature_quarterly['Allocation %'] / 3
+    feature_quarterly = monthly_df_filtered.groupby(['Quarter', 'Feature'], observed=True)['Allocation %'].sum().div(3)
     
     # Get top 8 features by total allocation
-    top_features = feature_quarterly.groupby('Feature')['Allocation %'].sum().nlargest(8).index.tolist()
-    feature_quarterly_top = feature_quarterly[feature_quarterly['Feature'].isin(top_features)]
+    top_features = top_category_labels(monthly_df_filtered['Feature'], monthly_df_filtered['Allocation %'], 8)
+    feature_quarterly_top = feature_quarterly[feature_quarterly.index.get_level_values('Feature').isin(top_features)]
     
     # Create pivot for line chart
-    feature_pivot = feature_quarterly_top.pivot(index='Quarter', columns='Feature', values='Allocation %').fillna(0)
+    feature_pivot = feature_quarterly_top.unstack('Feature', fill_value=0)
     
     # Sort quarters chronologically
     sorted_quarters = sort_quarters_chronologically(feature_pivot.index.tolist())
     feature_pivot = feature_pivot.reindex(sorted_quarters)
     
-    # Create line chart
-    fig_feature_trend = go.Figure()
-    
-    for feature in feature_pivot.columns:
-        fig_feature_trend.add_trace(go.Scatter(
+    # Create line chart, handing every trace to the figure in one call instead of add_trace per line
+    fig_feature_trend = go.Figure(data=[
+        go.Scatter(
             x=feature_pivot.index,
             y=feature_pivot[feature],
             mode='lines+markers',
@@ -896,7 +1356,9 @@ def generate_program_feature_quarterly_trends(monthly_df):
             line=dict(width=2),
             marker=dict(size=8),
             hovertemplate='%{x}<br>%{y:.1f}%<br>Feature: ' + feature + '<extra></extra>'
-        ))
+        )
+        for feature in feature_pivot.columns
+    ])
     
     fig_feature_trend.update_layout(
         title="Quarterly Top Features Allocation Trends",
@@ -921,106 +1383,118 @@ def generate_program_feature_quarterly_trends(monthly_df):
 # 3) Generate Excel File with Charts (Including Monthly Assignments)
 # ─────────────────────────────────────────────────────────────
 
-def generate_excel(engineers_df, monthly_df=None):
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        # Write data to separate sheets
-        engineers_df.to_excel(writer, sheet_name='Engineer Capacity', index=False)
-        
-        # Add future projects sheet if it exists in session state
-        if 'future_projects_df' in st.session_state and not st.session_state.future_projects_df.empty:
-            st.session_state.future_projects_df.to_excel(writer, sheet_name='Future Projects', index=False)
+def collect_excel_sheets(engineers_df, monthly_df=None):
+    """Build the export sheets in workbook order as (sheet name, DataFrame, include index)"""
+    sheets = [('Engineer Capacity', engineers_df, False)]
+    
+    # Add future projects sheet if it exists in session state
+    if 'future_projects_df' in st.session_state and not st.session_state.future_projects_df.empty:
+        sheets.append(('Future Projects', st.session_state.future_projects_df, False))
+    
+    # Add monthly assignments sheet
+    if monthly_df is not None and not monthly_df.empty:
+        sheets.append(('Monthly Assignments', monthly_df, False))
         
-        # Add monthly assignments sheet
-        if monthly_df is not None and not monthly_df.empty:
-            monthly_df.to_excel(writer, sheet_name='Monthly Assignments', index=False)
-            
-            # Create pivot table for monthly assignments
-            pivot_df = monthly_df.pivot_table(
-                index=['Engineer Name', 'Feature'],
-                columns='Month',
-                values='Allocation %',
-                fill_value=0
-            )
-            pivot_df.to_excel(writer, sheet_name='Monthly Assignment Matrix')
+        # Create pivot table for monthly assignments (groupby + unstack keeps pivot_table's mean aggregation;
+        # the groupby result is already sorted by engineer, feature and month, so no extra sort is needed)
+        pivot_df = (
+            monthly_df.groupby(['Engineer Name', 'Feature', 'Month'], observed=True)['Allocation %']
+            .mean()
+            .unstack('Month', fill_value=0)
+        )
+        sheets.append(('Monthly Assignment Matrix', pivot_df, True))
+    
+    return sheets
 
-        workbook = writer.book
+def generate_excel(engineers_df, monthly_df=None):
+    output = BytesIO()
+    sheets = collect_excel_sheets(engineers_df, monthly_df)
+    
+    if pyexcelerate_available:
+        # PyExcelerate writes whole rows in bulk instead of building a cell object per value
+        from pyexcelerate import Workbook as ExcelerateWorkbook
+        workbook = ExcelerateWorkbook()
+        for sheet_name, sheet_df, include_index in sheets:
+            if include_index:
+                sheet_df = sheet_df.reset_index()
+            # Ensure missing values become empty cells rather than the text "nan"
+            sheet_df = sheet_df.astype(object).where(sheet_df.notna(), None)
+            data = [[str(col) for col in sheet_df.columns]] + sheet_df.values.tolist()
+            workbook.new_sheet(sheet_name, data=data)
+        workbook.save(output)
+    else:
+        # Skip xlsxwriter's per-string URL regex check (cells are written as plain text) and
+        # assemble the xlsx zip in memory rather than through temporary files. constant_memory is not
+        # usable here: to_excel writes column by column, which that mode silently truncates, and
+        # in_memory overrides it anyway
+        with pd.ExcelWriter(
+            output, engine="xlsxwriter", engine_kwargs={'options': {'strings_to_urls': False, 'in_memory': True}}
+        ) as writer:
+            for sheet_name, sheet_df, include_index in sheets:
+                sheet_df.to_excel(writer, sheet_name=sheet_name, index=include_index)
     
     output.seek(0)
     return output
 
+@st.cache_data(show_spinner=False)
+def summarize_future_projects(total_projects, priority, engineer_counts):
+    """Future projects summary as (total projects, engineers needed, high priority count) in one cached pass"""
+    # Non-numeric counts are coerced to NaN and skipped; NaN means no numeric count at all
+    engineers_needed = (
+        pd.to_numeric(engineer_counts, errors='coerce').sum(min_count=1)
+        if engineer_counts is not None else float('nan')
+    )
+    high_priority_count = int(priority.eq('High').sum()) if priority is not None else 0
+    return total_projects, engineers_needed, high_priority_count
+
 # ─────────────────────────────────────────────────────────────
 # 4) Generate Future Projects Timeline Chart
 # ─────────────────────────────────────────────────────────────
 
-def generate_future_projects_timeline(future_projects_df):
-    """Generate a timeline chart for future projects"""
+@st.cache_data(show_spinner=False)
+def build_future_projects_timeline(future_projects_df, default_start):
+    """Build the timeline figure and displayed project count (cached on the frame contents and default start date)"""
+    # plotly.express is only needed for this chart, so it is imported on first use
+    import plotly.express as px
     
     if future_projects_df.empty:
-        return None
-    
-    # Prepare data for timeline
-    timeline_data = []
-    skipped_projects = []
-    
-    for idx, row in future_projects_df.iterrows():
-        try:
-            project_name = row.get('Project Name', f'Unnamed Project {idx+1}')
-            
-            # Handle dates more gracefully
-            try:
-                start_date = pd.to_datetime(row.get('Expected Start Date'))
-                if pd.isna(start_date):
-                    raise ValueError("Invalid start date")
-            except:
-                # Use a default start date if parsing fails
-                start_date = pd.to_datetime(datetime.now().strftime('%Y-%m-01'))
-                skipped_projects.append(f"{project_name}: Invalid/missing start date, using {start_date.strftime('%Y-%m-%d')}")
-            
-            try:
-                end_date = pd.to_datetime(row.get('Expected End Date'))
-                if pd.isna(end_date):
-                    raise ValueError("Invalid end date")
-            except:
-                # Use start date + 30 days as default end date
-                end_date = start_date + timedelta(days=30)
-                skipped_projects.append(f"{project_name}: Invalid/missing end date, using {end_date.strftime('%Y-%m-%d')}")
-            
-            # Ensure end date is after start date
-            if end_date <= start_date:
-                end_date = start_date + timedelta(days=1)
-                skipped_projects.append(f"{project_name}: End date before start date, adjusted to {end_date.strftime('%Y-%m-%d')}")
-            
-            priority = str(row.get('Priority', 'Medium'))
-            status = str(row.get('Status', 'Planning'))
-            
-            # Get engineer count, default to 1 if invalid
-            try:
-                engineers = int(float(row.get('Estimated Engineer Count', 1)))
-            except:
-                engineers = 1
-            
-            timeline_data.append({
-                'Project': project_name,
-                'Start': start_date,
-                'Finish': end_date,
-                'Priority': priority,
-                'Status': status,
-                'Engineers': engineers,
-                'Duration': (end_date - start_date).days
-            })
-            
-        except Exception as e:
-            # This should rarely happen now with better error handling above
-            project_name = row.get('Project Name', f'Unnamed Project {idx+1}')
-            skipped_projects.append(f"{project_name}: Unexpected error - {str(e)}")
-            continue
-    
-    if not timeline_data:
-        st.error("No valid projects could be displayed in the timeline. Please check your project data.")
-        return None
+        return None, 0
+    
+    def column(name, default):
+        """The named column, or the default for every row when the column is missing"""
+        if name in future_projects_df.columns:
+            return future_projects_df[name]
+        return pd.Series(default, index=future_projects_df.index, dtype=object)
+    
+    # Parse each date column in one pass ("mixed" parses every cell on its own, like a per-row to_datetime);
+    # a missing start uses the default start, a missing end is 30 days later, and an end not after the start
+    # becomes start + 1 day
+    start_dates = pd.to_datetime(column('Expected Start Date', None), errors='coerce', format='mixed')
+    start_dates = start_dates.fillna(pd.to_datetime(default_start))
+    end_dates = pd.to_datetime(column('Expected End Date', None), errors='coerce', format='mixed')
+    end_dates = end_dates.fillna(start_dates + pd.Timedelta(days=30))
+    end_dates = end_dates.where(end_dates > start_dates, start_dates + pd.Timedelta(days=1))
+    
+    # Engineer count truncated to an int, 1 when missing or not a finite number
+    engineer_counts = pd.to_numeric(column('Estimated Engineer Count', 1), errors='coerce').astype(float)
+    engineer_counts = np.trunc(engineer_counts.where(np.isfinite(engineer_counts), 1)).astype(int)
+    
+    if 'Project Name' in future_projects_df.columns:
+        project_names = future_projects_df['Project Name']
+    else:
+        project_names = pd.Series(
+            [f'Unnamed Project {idx+1}' for idx in future_projects_df.index], index=future_projects_df.index
+        )
     
-    timeline_df = pd.DataFrame(timeline_data)
+    timeline_df = pd.DataFrame({
+        'Project': project_names,
+        'Start': start_dates,
+        'Finish': end_dates,
+        'Priority': column('Priority', 'Medium').astype(str),
+        'Status': column('Status', 'Planning').astype(str),
+        'Engineers': engineer_counts,
+        'Duration': (end_dates - start_dates).dt.days
+    }).reset_index(drop=True)
     
     # Sort by start date
     timeline_df = timeline_df.sort_values('Start')
@@ -1055,8 +1529,22 @@ def generate_future_projects_timeline(future_projects_df):
         margin=dict(l=200)  # More space for project names
     )
     
+    return fig, len(timeline_df)
+
+def generate_future_projects_timeline(future_projects_df):
+    """Generate a timeline chart for future projects"""
+    
+    if future_projects_df.empty:
+        return None
+    
+    # Ensure the default start date is part of the cache key so it rolls over with the month
+    fig, displayed_projects = build_future_projects_timeline(future_projects_df, datetime.now().strftime('%Y-%m-01'))
+    if fig is None:
+        st.error("No valid projects could be displayed in the timeline. Please check your project data.")
+        return None
+    
     # Show summary below the chart
-    st.write(f"**Timeline Summary:** Showing {len(timeline_df)} of {len(future_projects_df)} total projects")
+    st.write(f"**Timeline Summary:** Showing {displayed_projects} of {len(future_projects_df)} total projects")
     
     return fig
 
@@ -1071,76 +1559,30 @@ monthly_assignments_file = "monthly_assignments.csv"
 
 # Initialize Engineers DataFrame
 # Always try to load from CSV first to get the latest saved data
+# Upgrades below only mark the frame dirty; it is written back once at the end of initialization
+engineers_dirty = False
+# True while engineers_df holds the cached loader's output, whose PTO columns are already numeric and summed
+pto_totals_current = False
 try:
-    loaded_df = pd.read_csv(engineer_file)
-    # Remove old PTO Days column if it exists (legacy cleanup)
-    if 'PTO Days' in loaded_df.columns:
-        loaded_df = loaded_df.drop(columns=['PTO Days'])
-        # Save immediately to persist the removal
-        loaded_df.to_csv(engineer_file, index=False)
-        st.info("ℹ️ Legacy 'PTO Days' column removed. Using monthly PTO management instead.")
-    # Clean up Engineer Name column - convert to string, handle NaN, and strip whitespace
-    loaded_df['Engineer Name'] = loaded_df['Engineer Name'].fillna('').astype(str).str.strip()
-    # Remove completely empty rows
-    loaded_df = loaded_df[loaded_df.astype(str).ne('').any(axis=1)]
-    
-    # Ensure all required columns exist
-    if "Team" not in loaded_df.columns:
-        loaded_df["Team"] = ""
-    if "Annual PTO Days" not in loaded_df.columns:
-        loaded_df["Annual PTO Days"] = 0
-    if "Notes" not in loaded_df.columns:
-        loaded_df["Notes"] = ""
-    if "Role" not in loaded_df.columns:
-        loaded_df["Role"] = ""
-    if "Skills" not in loaded_df.columns:
-        loaded_df["Skills"] = ""
-    if "Weekly Hours" not in loaded_df.columns:
-        loaded_df["Weekly Hours"] = 40
-    
-    # Add monthly PTO columns if they don't exist
-    current_date = datetime.now()
-    pto_columns_added = False
-    
-    # First, add columns for the next 12 months from current date
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        month_key = f"PTO_{month_date.strftime('%Y_%m')}"
-        if month_key not in loaded_df.columns:
-            loaded_df[month_key] = 0
-            pto_columns_added = True
-    
-    # Check for any existing monthly assignments and add PTO columns for those months
-    try:
-        if os.path.exists(monthly_assignments_file):
-            temp_monthly = pd.read_csv(monthly_assignments_file)
-            if not temp_monthly.empty and 'Month' in temp_monthly.columns:
-                for month in temp_monthly['Month'].unique():
-                    month_key = f"PTO_{month.replace('-', '_')}"
-                    if month_key not in loaded_df.columns:
-                        loaded_df[month_key] = 0
-                        pto_columns_added = True
-    except:
-        pass
-    
-    # Recalculate Annual PTO Days
-    pto_columns = [col for col in loaded_df.columns if col.startswith("PTO_")]
-    if pto_columns:
-        # Ensure all PTO values are numeric
-        for col in pto_columns:
-            loaded_df[col] = pd.to_numeric(loaded_df[col], errors='coerce').fillna(0)
-        loaded_df['Annual PTO Days'] = loaded_df[pto_columns].sum(axis=1)
+    # Parsing and schema upgrades are cached per file version, so reruns skip them until a file changes
+    monthly_mtime = os.stat(monthly_assignments_file).st_mtime_ns if os.path.exists(monthly_assignments_file) else None
+    loaded_df, legacy_pto_removed, pto_columns_added = load_engineers_for_mtime(
+        engineer_file, os.stat(engineer_file).st_mtime_ns,
+        monthly_assignments_file, monthly_mtime, datetime.now().strftime("%Y-%m-%d")
+    )
     
-    # Save if we made changes
-    if pto_columns_added:
-        loaded_df.to_csv(engineer_file, index=False)
+    # Persist upgrades once at the end of initialization
+    engineers_dirty = legacy_pto_removed or pto_columns_added
+    if legacy_pto_removed:
+        st.info("ℹ️ Legacy 'PTO Days' column removed. Using monthly PTO management instead.")
     
     st.session_state.engineers_df = loaded_df
+    pto_totals_current = True
 except FileNotFoundError:
     # Only use default if file doesn't exist
     if "engineers_df" not in st.session_state:
         st.session_state.engineers_df = default_engineers()
-        st.session_state.engineers_df.to_csv(engineer_file, index=False)
+        save_csv(st.session_state.engineers_df, engineer_file)
 except Exception as e:
     st.error(f"Error loading engineers data: {str(e)}")
     st.info("Using default data instead.")
@@ -1149,20 +1591,12 @@ except Exception as e:
 
 # Initialize Monthly Assignments DataFrame - always reload to get latest
 try:
-    loaded_monthly_df = pd.read_csv(monthly_assignments_file)
-    # Ensure Engineer Name is string type and stripped
-    loaded_monthly_df['Engineer Name'] = loaded_monthly_df['Engineer Name'].fillna('').astype(str).str.strip()
-    # Ensure Allocation % is numeric
-    if 'Allocation %' in loaded_monthly_df.columns:
-        loaded_monthly_df['Allocation %'] = pd.to_numeric(loaded_monthly_df['Allocation %'], errors='coerce').fillna(0)
-    # Add Program column if it doesn't exist
-    if 'Program' not in loaded_monthly_df.columns:
-        loaded_monthly_df['Program'] = 'Default Program'
-    # Add Priority column if it doesn't exist
-    if 'Priority' not in loaded_monthly_df.columns:
-        loaded_monthly_df['Priority'] = 'Medium'
+    loaded_monthly_df, priority_added = load_monthly_assignments_for_mtime(
+        monthly_assignments_file, os.stat(monthly_assignments_file).st_mtime_ns
+    )
+    if priority_added:
         # Save the updated dataframe
-        loaded_monthly_df.to_csv(monthly_assignments_file, index=False)
+        save_csv(loaded_monthly_df, monthly_assignments_file)
     st.session_state.monthly_assignments_df = loaded_monthly_df
 except FileNotFoundError:
     if "monthly_assignments_df" not in st.session_state:
@@ -1174,15 +1608,11 @@ except Exception as e:
 
 engineers_df = st.session_state.engineers_df
 
-# Ensure Engineer Name column is string type and stripped
-engineers_df['Engineer Name'] = engineers_df['Engineer Name'].fillna('').astype(str).str.strip()
-
 # Remove PTO Days column if it still exists (for already loaded data)
 if 'PTO Days' in engineers_df.columns:
     engineers_df = engineers_df.drop(columns=['PTO Days'])
     st.session_state.engineers_df = engineers_df
-    # Save immediately to persist the removal
-    engineers_df.to_csv(engineer_file, index=False)
+    engineers_dirty = True
     st.info("ℹ️ Legacy 'PTO Days' column has been removed and data saved. Using Annual PTO Days (auto-calculated from monthly values).")
 
 # Ensure required columns exist with proper defaults
@@ -1199,48 +1629,41 @@ if "Skills" not in engineers_df.columns:
 if "Weekly Hours" not in engineers_df.columns:
     engineers_df["Weekly Hours"] = 40
 
-# Add monthly PTO columns if they don't exist
-current_date = datetime.now()
-pto_columns_added = False
-
-# First, add columns for the next 12 months from current date
-for i in range(12):
-    month_date = current_date + timedelta(days=30*i)
-    month_key = f"PTO_{month_date.strftime('%Y_%m')}"
-    if month_key not in engineers_df.columns:
-        engineers_df[month_key] = 0
-        pto_columns_added = True
+# Add monthly PTO columns if they don't exist, starting with the next 12 months from current date
+engineers_df, added_keys = add_missing_pto_columns(engineers_df, get_next_months(12, date_format="PTO_%Y_%m"))
+engineers_dirty = engineers_dirty or bool(added_keys)
+pto_totals_current = pto_totals_current and not added_keys
 
 # Also check if we have any monthly assignments and add PTO columns for those months
 if 'monthly_assignments_df' in st.session_state:
     monthly_df_temp = st.session_state.monthly_assignments_df
     if not monthly_df_temp.empty and 'Month' in monthly_df_temp.columns:
-        for month in monthly_df_temp['Month'].unique():
-            month_key = f"PTO_{month.replace('-', '_')}"
-            if month_key not in engineers_df.columns:
-                engineers_df[month_key] = 0
-                pto_columns_added = True
-                st.info(f"Added PTO column for {month}")
-
-# Recalculate Annual PTO Days to ensure it's correct
-pto_columns = [col for col in engineers_df.columns if col.startswith("PTO_")]
-if pto_columns:
+        assignment_months = {f"PTO_{month.replace('-', '_')}": month for month in monthly_df_temp['Month'].unique()}
+        engineers_df, added_keys = add_missing_pto_columns(engineers_df, assignment_months)
+        if added_keys:
+            engineers_dirty = True
+            pto_totals_current = False
+            for month_key in added_keys:
+                st.info(f"Added PTO column for {assignment_months[month_key]}")
+
+# Recalculate Annual PTO Days to ensure it's correct (skipped when the cached loader already did it this rerun)
+pto_columns = get_pto_columns(engineers_df)
+if pto_columns and not pto_totals_current:
     # Ensure all PTO values are numeric
-    for col in pto_columns:
-        engineers_df[col] = pd.to_numeric(engineers_df[col], errors='coerce').fillna(0)
+    coerce_pto_columns(engineers_df, pto_columns)
     engineers_df['Annual PTO Days'] = engineers_df[pto_columns].sum(axis=1)
 
 # Ensure Skills column exists
 if "Skills" not in engineers_df.columns:
     engineers_df["Skills"] = ""
-    pto_columns_added = True  # Mark that we need to save
+    engineers_dirty = True  # Mark that we need to save
 
 # Update session state after adding columns
 st.session_state.engineers_df = engineers_df
 
-# Save if we added new columns or made changes
-if pto_columns_added:
-    engineers_df.to_csv(engineer_file, index=False)
+# Save once if we added new columns or made changes
+if engineers_dirty:
+    save_csv(engineers_df, engineer_file)
 
 st.header("👥 Engineer Management")
 
@@ -1263,16 +1686,14 @@ with col3:
         if 'monthly_assignments_df' in st.session_state:
             monthly_df_temp = st.session_state.monthly_assignments_df
             if not monthly_df_temp.empty and 'Month' in monthly_df_temp.columns:
-                for month in monthly_df_temp['Month'].unique():
-                    month_key = f"PTO_{month.replace('-', '_')}"
-                    if month_key not in engineers_df.columns:
-                        engineers_df[month_key] = 0
-                        st.info(f"Added missing PTO column: {month_key}")
+                month_keys = [f"PTO_{month.replace('-', '_')}" for month in monthly_df_temp['Month'].unique()]
+                engineers_df, added_keys = add_missing_pto_columns(engineers_df, month_keys)
+                for month_key in added_keys:
+                    st.info(f"Added missing PTO column: {month_key}")
         
         # Ensure all PTO values are numeric
-        pto_columns = [col for col in engineers_df.columns if col.startswith("PTO_")]
-        for col in pto_columns:
-            engineers_df[col] = pd.to_numeric(engineers_df[col], errors='coerce').fillna(0)
+        pto_columns = get_pto_columns(engineers_df)
+        coerce_pto_columns(engineers_df, pto_columns)
         
         # Ensure Skills column exists
         if "Skills" not in engineers_df.columns:
@@ -1283,7 +1704,7 @@ with col3:
         
         # Save changes
         st.session_state.engineers_df = engineers_df
-        engineers_df.to_csv(engineer_file, index=False)
+        save_csv(engineers_df, engineer_file)
         st.success("Fixed PTO data and added missing columns!")
         st.rerun()
 
@@ -1314,9 +1735,7 @@ with eng_tab1:
                     }
                     
                     # Add PTO columns
-                    for col in engineers_df.columns:
-                        if col.startswith("PTO_"):
-                            new_row[col] = 0
+                    new_row.update(dict.fromkeys(get_pto_columns(engineers_df), 0))
                     
                     # Add to dataframe
                     new_engineer_df = pd.DataFrame([new_row])
@@ -1324,20 +1743,19 @@ with eng_tab1:
                     
                     # Update and save
                     st.session_state.engineers_df = engineers_df
-                    st.session_state.full_engineers_data = engineers_df.to_dict('records')
-                    engineers_df.to_csv(engineer_file, index=False)
+                    save_csv(engineers_df, engineer_file)
                     st.success(f"Added engineer: {new_name}")
                     st.rerun()
                 else:
                     st.error("Please enter an engineer name.")
 
     # Calculate Annual PTO Days as sum of monthly PTO
-    pto_columns = [col for col in engineers_df.columns if col.startswith("PTO_")]
+    pto_columns = get_pto_columns(engineers_df)
     if pto_columns:
         engineers_df['Annual PTO Days'] = engineers_df[pto_columns].sum(axis=1)
     
     # Display only non-PTO columns for basic info (excluding monthly PTO_ columns and old PTO Days)
-    display_cols = [col for col in engineers_df.columns if not col.startswith("PTO_") and col != "PTO Days"]
+    display_cols = get_display_columns(engineers_df)
     
     # IMPORTANT: Always get the latest data from session state
     engineers_df = st.session_state.engineers_df.copy()
@@ -1361,9 +1779,10 @@ with eng_tab1:
             if st.button("Apply Engineer Renames", key="apply_eng_renames"):
                 engineers_df = engineers_df.rename(columns=eng_renames)
                 st.session_state.engineers_df = engineers_df
-                engineers_df.to_csv(engineer_file, index=False)
+                save_csv(engineers_df, engineer_file)
                 st.success("Engineer column names updated and saved!")
 
+        AgGrid, GridOptionsBuilder = get_aggrid()
         gb_eng = GridOptionsBuilder.from_dataframe(engineers_df[display_cols])
         gb_eng.configure_default_column(editable=True)
         # Make Annual PTO Days read-only since it's calculated
@@ -1384,69 +1803,45 @@ with eng_tab1:
         # Update the dataframe with edited values
         if eng_response and eng_response['data'] is not None:
             edited_df = pd.DataFrame(eng_response['data'])
+            # Grid rows come back positionally, so line them up with the frame's own row labels
+            if len(edited_df) == len(engineers_df):
+                edited_df.index = engineers_df.index
             
-            # Check if data has changed
+            # Check if data has changed; an unchanged grid signature (row order included) means this rerun came from another widget
             data_changed = False
-            for col in display_cols:
-                if col != 'Annual PTO Days' and col in edited_df.columns:
-                    if not engineers_df[col].equals(edited_df[col]):
-                        data_changed = True
-                        engineers_df[col] = edited_df[col]
+            editor_signature = frame_signature(edited_df)
+            if st.session_state.get('_editor_hash') != editor_signature:
+                st.session_state._editor_hash = editor_signature
+                for col in display_cols:
+                    if col != 'Annual PTO Days' and col in edited_df.columns:
+                        if not engineers_df[col].equals(edited_df[col]):
+                            data_changed = True
+                            engineers_df[col] = edited_df[col]
             
             if data_changed:
                 # Ensure Engineer Name is string type and stripped
-                engineers_df['Engineer Name'] = engineers_df['Engineer Name'].fillna('').astype(str).str.strip()
+                normalize_engineer_names(engineers_df)
                 # Remove any rows with completely empty names before saving
                 engineers_df = engineers_df[engineers_df['Engineer Name'] != '']
                 st.session_state.engineers_df = engineers_df
                 # Auto-save to CSV
-                engineers_df.to_csv(engineer_file, index=False)
+                save_csv(engineers_df, engineer_file)
                 st.success("✅ Engineer data auto-saved!")
     else:
         # FIXED: More robust data editor implementation
         st.info("ℹ️ Table editing is enabled. Click 'Save Engineer Changes' button below to save your edits.")
         
-        column_config = {
-            "Annual PTO Days": st.column_config.NumberColumn(
-                "Annual PTO Days",
-                help="Auto-calculated sum of monthly PTO days",
-                disabled=True,
-            ),
-            "Engineer Name": st.column_config.TextColumn(
-                "Engineer Name",
-                help="Enter the engineer's name",
-                required=True,
-            ),
-            "Skills": st.column_config.TextColumn(
-                "Skills",
-                help="Enter skills comma-separated (e.g., Python, AWS, React)",
-            ),
-            "Weekly Hours": st.column_config.NumberColumn(
-                "Weekly Hours",
-                help="Weekly working hours",
-                min_value=0,
-                max_value=168,
-                step=1,
-            )
-        }
-        
-        # Store full dataframe in session state if not already there
-        if 'full_engineers_data' not in st.session_state:
-            st.session_state.full_engineers_data = engineers_df.to_dict('records')
-        
         # Store edited data separately to prevent loss
-        if 'edited_engineers_data' not in st.session_state:
-            st.session_state.edited_engineers_data = None
+        st.session_state.setdefault('edited_engineers_data', None)
         
-        # Always sync from session state first
-        engineers_df = pd.DataFrame(st.session_state.full_engineers_data)
+        # Always sync from the session DataFrame; positional labels keep edits aligned with editor rows
+        engineers_df = engineers_df.reset_index(drop=True)
         if engineers_df.empty:
             engineers_df = default_engineers()
-            st.session_state.full_engineers_data = engineers_df.to_dict('records')
         
         # Ensure we have the PTO columns
-        pto_columns = [col for col in engineers_df.columns if col.startswith("PTO_")]
-        display_cols = [col for col in engineers_df.columns if not col.startswith("PTO_") and col != "PTO Days"]
+        pto_columns = get_pto_columns(engineers_df)
+        display_cols = get_display_columns(engineers_df)
         
         # Create display dataframe
         display_df = engineers_df[display_cols].copy()
@@ -1455,7 +1850,7 @@ with eng_tab1:
         edited_df = st.data_editor(
             display_df,
             key="engineers_data_editor",
-            column_config=column_config,
+            column_config=get_engineer_editor_column_config(),
             num_rows="fixed",  # Changed from "dynamic" to prevent data loss
             on_change=None  # Disable auto-update
         )
@@ -1472,42 +1867,28 @@ with eng_tab1:
                     try:
                         edited_df = st.session_state.edited_engineers_data
                         
-                        # Build complete new dataframe
-                        new_full_data = []
+                        # Build complete new dataframe: editor rows keep the positional labels of engineers_df,
+                        # so the PTO columns carry over with one index-aligned join instead of a per-row merge
+                        new_engineers_df = edited_df.join(engineers_df[pto_columns])
                         
-                        for idx, row in edited_df.iterrows():
-                            new_row = row.to_dict()
-                            
-                            # Add PTO columns from existing data
-                            if idx < len(engineers_df):
-                                for pto_col in pto_columns:
-                                    new_row[pto_col] = engineers_df.iloc[idx][pto_col]
-                            
-                            # Calculate Annual PTO
-                            annual_pto = sum(new_row.get(col, 0) for col in pto_columns)
-                            new_row['Annual PTO Days'] = annual_pto
-                            
-                            new_full_data.append(new_row)
-                        
-                        # Create new dataframe
-                        new_engineers_df = pd.DataFrame(new_full_data)
+                        # Calculate Annual PTO
+                        new_engineers_df['Annual PTO Days'] = new_engineers_df[pto_columns].sum(axis=1)
                         
                         # Clean up
-                        new_engineers_df['Engineer Name'] = new_engineers_df['Engineer Name'].fillna('').astype(str).str.strip()
+                        normalize_engineer_names(new_engineers_df)
                         new_engineers_df = new_engineers_df[new_engineers_df['Engineer Name'] != '']
                         
                         # Ensure column order
-                        col_order = ['Team', 'Engineer Name', 'Role', 'Skills', 'Weekly Hours', 'Annual PTO Days'] + pto_columns + ['Notes']
+                        col_order = ENGINEER_COLUMN_ORDER + pto_columns + ['Notes']
                         existing_cols = [col for col in col_order if col in new_engineers_df.columns]
                         extra_cols = [col for col in new_engineers_df.columns if col not in col_order]
                         new_engineers_df = new_engineers_df[existing_cols + extra_cols]
                         
                         # Update all state
                         st.session_state.engineers_df = new_engineers_df
-                        st.session_state.full_engineers_data = new_engineers_df.to_dict('records')
                         
                         # Save to CSV
-                        new_engineers_df.to_csv(engineer_file, index=False)
+                        save_csv(new_engineers_df, engineer_file)
                         st.success("✅ Engineer data saved!")
                         
                         # Clear edited data
@@ -1533,26 +1914,105 @@ with eng_tab1:
                 key="delete_engineer_select"
             )
             if st.button("Delete Selected Engineer", key="delete_engineer_btn"):
-                engineers_df = engineers_df[engineers_df['Engineer Name'].str.strip() != engineer_to_delete.strip()]
+                engineers_df = engineers_df[engineers_df['Engineer Name'] != engineer_to_delete]
                 st.session_state.engineers_df = engineers_df
-                st.session_state.full_engineers_data = engineers_df.to_dict('records')
-                engineers_df.to_csv(engineer_file, index=False)
+                save_csv(engineers_df, engineer_file)
                 st.success(f"Deleted engineer: {engineer_to_delete}")
                 st.rerun()
     
     st.info("ℹ️ Annual PTO Days is automatically calculated as the sum of all monthly PTO values. Add skills for better project matching!")
 
+# Partial reruns keep PTO tweaks from re-running the whole page; older Streamlit versions run it inline
+st_fragment = st.fragment if hasattr(st, 'fragment') else (lambda func: func)
+
+@st_fragment
+def render_pto_editor(engineers_df, selected_engineer_pto):
+    """Monthly PTO inputs and quick actions for one engineer"""
+    # Find the engineer index safely
+    engineer_idx = find_engineer_index(engineers_df, selected_engineer_pto)
+
+    if engineer_idx is not None:
+        # Display monthly PTO in columns
+        st.write(f"**Monthly PTO for {selected_engineer_pto}:**")
+
+        # The 12 inputs submit together, so editing several months costs one rerun and one save
+        with st.form(f"pto_form_{selected_engineer_pto}"):
+            # Create 3 columns for 4 months each
+            col_groups = [st.columns(4) for _ in range(3)]
+
+            month_updates = {}
+            month_keys = get_next_months(12, date_format="PTO_%Y_%m")
+            month_displays = get_next_months(12, date_format="%B %Y")
+            # Read the engineer's 12 PTO values in one row slice instead of a label lookup per month (missing columns read 0)
+            row_position = engineers_df.index.get_loc(engineer_idx)
+            current_values = engineers_df.iloc[[row_position]].reindex(columns=month_keys, fill_value=0).to_numpy()[0]
+            for i, (month_key, month_display, current_value) in enumerate(zip(month_keys, month_displays, current_values)):
+
+                col_idx = i % 4
+                row_idx = i // 4
+
+                with col_groups[row_idx][col_idx]:
+                    new_value = st.number_input(
+                        month_display,
+                        min_value=0.0,
+                        max_value=22.0,
+                        value=float(current_value),
+                        step=0.5,
+                        key=f"pto_{selected_engineer_pto}_{month_key}"
+                    )
+                    if new_value != current_value:
+                        month_updates[month_key] = new_value
+
+            pto_submitted = st.form_submit_button("💾 Save PTO")
+
+        if pto_submitted and month_updates:
+            # Write all changed months in one row assignment, then recalculate Annual PTO Days
+            engineers_df.loc[engineer_idx, list(month_updates)] = list(month_updates.values())
+            pto_columns = get_pto_columns(engineers_df)
+            engineers_df['Annual PTO Days'] = engineers_df[pto_columns].sum(axis=1)
+            st.session_state.engineers_df = engineers_df
+            # Save PTO changes
+            save_csv(engineers_df, engineer_file)
+            st.success("✅ PTO data saved!")
+
+        # Show total PTO days
+        total_pto = engineers_df.loc[engineer_idx, 'Annual PTO Days']
+        st.metric(f"Total Annual PTO Days for {selected_engineer_pto}", f"{total_pto:.1f} days")
+
+        # Quick actions
+        pto_columns = get_pto_columns(engineers_df)
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Clear All PTO", key=f"clear_pto_{selected_engineer_pto}"):
+                # Single slice write for all PTO months of this engineer
+                engineers_df.loc[engineer_idx, pto_columns] = 0
+                engineers_df.at[engineer_idx, 'Annual PTO Days'] = 0
+                st.session_state.engineers_df = engineers_df
+                # Auto-save
+                save_csv(engineers_df, engineer_file)
+                st.success("Cleared all PTO days and saved!")
+                st.rerun()
+
+        with col2:
+            quick_fill = st.number_input("Quick fill value", min_value=0.0, max_value=5.0, value=0.0, step=0.5)
+            if st.button("Apply to All Months", key=f"fill_pto_{selected_engineer_pto}"):
+                # Only this engineer's row changes, so its annual total is known without re-summing the frame
+                engineers_df.loc[engineer_idx, pto_columns] = quick_fill
+                engineers_df.at[engineer_idx, 'Annual PTO Days'] = quick_fill * len(pto_columns)
+                st.session_state.engineers_df = engineers_df
+                # Auto-save
+                save_csv(engineers_df, engineer_file)
+                st.success(f"Set {quick_fill} days for all months and saved!")
+                st.rerun()
+    else:
+        st.error(f"Engineer '{selected_engineer_pto}' not found in the data.")
+
 with eng_tab2:
     st.subheader("Monthly PTO Days Management")
     st.info("Set PTO days for each engineer by month. Annual PTO Days will be automatically calculated.")
     
     # Select engineer to manage PTO
-    engineer_names = engineers_df['Engineer Name'].tolist()
-    # Filter out empty names and handle different data types
-    valid_engineer_names = []
-    for name in engineer_names:
-        if name is not None and str(name).strip() and str(name) != 'nan':
-            valid_engineer_names.append(str(name).strip())
+    valid_engineer_names = get_valid_engineer_names(engineers_df)
     
     if not valid_engineer_names:
         st.warning("No engineers with names found. Please add engineer names in the Engineer Data tab first.")
@@ -1560,85 +2020,7 @@ with eng_tab2:
         selected_engineer_pto = st.selectbox("Select Engineer for PTO Management:", valid_engineer_names, key="pto_mgmt_engineer")
         
         if selected_engineer_pto:
-            # Find the engineer index safely
-            engineer_matches = engineers_df[engineers_df['Engineer Name'].astype(str) == str(selected_engineer_pto)]
-            
-            if not engineer_matches.empty:
-                engineer_idx = engineer_matches.index[0]
-                
-                # Display monthly PTO in columns
-                st.write(f"**Monthly PTO for {selected_engineer_pto}:**")
-                
-                # Create 3 columns for 4 months each
-                col_groups = [st.columns(4) for _ in range(3)]
-                
-                month_updated = False
-                current_date = datetime.now()
-                for i in range(12):
-                    month_date = current_date + timedelta(days=30*i)
-                    month_key = f"PTO_{month_date.strftime('%Y_%m')}"
-                    month_display = month_date.strftime("%B %Y")
-                    
-                    col_idx = i % 4
-                    row_idx = i // 4
-                    
-                    with col_groups[row_idx][col_idx]:
-                        current_value = engineers_df.loc[engineer_idx, month_key] if month_key in engineers_df.columns else 0
-                        new_value = st.number_input(
-                            month_display,
-                            min_value=0.0,
-                            max_value=22.0,
-                            value=float(current_value),
-                            step=0.5,
-                            key=f"pto_{selected_engineer_pto}_{month_key}"
-                        )
-                        if new_value != current_value:
-                            engineers_df.loc[engineer_idx, month_key] = new_value
-                            month_updated = True
-                
-                if month_updated:
-                    # Recalculate Annual PTO Days
-                    pto_columns = [col for col in engineers_df.columns if col.startswith("PTO_")]
-                    engineers_df['Annual PTO Days'] = engineers_df[pto_columns].sum(axis=1)
-                    # Ensure names are stripped
-                    engineers_df['Engineer Name'] = engineers_df['Engineer Name'].fillna('').astype(str).str.strip()
-                    st.session_state.engineers_df = engineers_df
-                    # Auto-save PTO changes
-                    engineers_df.to_csv(engineer_file, index=False)
-                    st.success("✅ PTO data auto-saved!")
-                    
-                # Show total PTO days
-                total_pto = engineers_df.loc[engineer_idx, 'Annual PTO Days']
-                st.metric(f"Total Annual PTO Days for {selected_engineer_pto}", f"{total_pto:.1f} days")
-                
-                # Quick actions
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("Clear All PTO", key=f"clear_pto_{selected_engineer_pto}"):
-                        for col in engineers_df.columns:
-                            if col.startswith("PTO_"):
-                                engineers_df.loc[engineer_idx, col] = 0
-                        engineers_df.loc[engineer_idx, 'Annual PTO Days'] = 0
-                        st.session_state.engineers_df = engineers_df
-                        # Auto-save
-                        engineers_df.to_csv(engineer_file, index=False)
-                        st.success("Cleared all PTO days and saved!")
-                        st.rerun()
-                
-                with col2:
-                    quick_fill = st.number_input("Quick fill value", min_value=0.0, max_value=5.0, value=0.0, step=0.5)
-                    if st.button("Apply to All Months", key=f"fill_pto_{selected_engineer_pto}"):
-                        for col in engineers_df.columns:
-                            if col.startswith("PTO_"):
-                                engineers_df.loc[engineer_idx, col] = quick_fill
-                        engineers_df['Annual PTO Days'] = engineers_df[pto_columns].sum(axis=1)
-                        st.session_state.engineers_df = engineers_df
-                        # Auto-save
-                        engineers_df.to_csv(engineer_file, index=False)
-                        st.success(f"Set {quick_fill} days for all months and saved!")
-                        st.rerun()
-            else:
-                st.error(f"Engineer '{selected_engineer_pto}' not found in the data.")
+            render_pto_editor(engineers_df, selected_engineer_pto)
 
 # ─────────────────────────────────────────────────────────────
 # NEW SECTION: Monthly Feature Assignments with Edit Functionality
@@ -1649,30 +2031,29 @@ st.header("📅 Monthly Feature Assignments")
 # Get monthly_df from session state - use reference, not copy
 monthly_df = st.session_state.monthly_assignments_df
 
-# Ensure proper data types and strip whitespace
-if 'Engineer Name' in monthly_df.columns:
-    monthly_df['Engineer Name'] = monthly_df['Engineer Name'].fillna('').astype(str).str.strip()
-    # Ensure Allocation % is numeric
-    if 'Allocation %' in monthly_df.columns:
-        monthly_df['Allocation %'] = pd.to_numeric(monthly_df['Allocation %'], errors='coerce').fillna(0)
+# Ensure Allocation % is numeric (Engineer Name is already normalized at load time)
+if 'Allocation %' in monthly_df.columns:
+    monthly_df['Allocation %'] = pd.to_numeric(monthly_df['Allocation %'], errors='coerce').fillna(0)
 
-# Add Program column if it doesn't exist
+# Add Program and Priority columns if they don't exist, saving once for both
+monthly_columns_added = False
 if 'Program' not in monthly_df.columns:
     monthly_df['Program'] = 'Default Program'
-    st.session_state.monthly_assignments_df = monthly_df
-    monthly_df.to_csv(monthly_assignments_file, index=False)
-
-# Add Priority column if it doesn't exist
+    monthly_columns_added = True
 if 'Priority' not in monthly_df.columns:
     monthly_df['Priority'] = 'Medium'
+    monthly_columns_added = True
+if monthly_columns_added:
     st.session_state.monthly_assignments_df = monthly_df
-    monthly_df.to_csv(monthly_assignments_file, index=False)
+    save_csv(monthly_df, monthly_assignments_file)
 
 # Initialize editing state if not exists
-if 'editing_assignment' not in st.session_state:
-    st.session_state.editing_assignment = None
-if 'edit_mode' not in st.session_state:
-    st.session_state.edit_mode = False
+st.session_state.setdefault('editing_assignment', None)
+st.session_state.setdefault('edit_mode', False)
+
+# Valid engineer names are shared by the Add and Edit tabs; the PTO tab above already filtered the same
+# roster this rerun (its edits only touch PTO columns), so its list is reused rather than rebuilt
+valid_engineers = valid_engineer_names
 
 # Tabs for Add/Edit modes
 assignment_tab1, assignment_tab2 = st.tabs(["➕ Add Assignment", "✏️ Edit Assignment"])
@@ -1682,13 +2063,6 @@ with assignment_tab1:
     col1, col2 = st.columns(2)
 
     with col1:
-        engineer_list = engineers_df['Engineer Name'].tolist()
-        # Filter out empty names and handle different data types
-        valid_engineers = []
-        for name in engineer_list:
-            if name is not None and str(name).strip() and str(name) != 'nan':
-                valid_engineers.append(str(name).strip())
-        
         if not valid_engineers:
             st.warning("No engineers with names found. Please add engineer names first.")
             selected_engineer = None
@@ -1710,11 +2084,7 @@ with assignment_tab1:
 
     with col5:
         # Generate month options
-        current_date = datetime.now()
-        month_options = []
-        for i in range(12):  # Next 12 months
-            month_date = current_date + timedelta(days=30*i)
-            month_options.append(month_date.strftime("%Y-%m"))
+        month_options = get_next_months(12)  # Next 12 months
         selected_month = st.selectbox("Month", options=month_options, key="monthly_month")
 
     with col6:
@@ -1739,14 +2109,13 @@ with assignment_tab1:
                 }
                 # Get current dataframe
                 current_df = st.session_state.monthly_assignments_df
-                # Add new assignment
-                new_df = pd.concat([current_df, pd.DataFrame([new_assignment])], ignore_index=True)
-                # Ensure all engineer names are stripped
-                new_df['Engineer Name'] = new_df['Engineer Name'].fillna('').astype(str).str.strip()
+                # Add new assignment as a one-row concat (a lone row when the table is empty); loaded rows are already normalized
+                new_row = pd.DataFrame([new_assignment])
+                new_df = new_row if current_df.empty else pd.concat([current_df, new_row], ignore_index=True)
                 # Update session state
                 st.session_state.monthly_assignments_df = new_df
                 # Auto-save
-                new_df.to_csv(monthly_assignments_file, index=False)
+                save_csv(new_df, monthly_assignments_file)
                 st.success(f"Added assignment: {selected_engineer} -> {feature_name} ({allocation_percent}%) for {selected_month} - Priority: {priority}")
                 # Clear the monthly_df cache
                 if 'monthly_df' in locals():
@@ -1760,10 +2129,8 @@ with assignment_tab1:
         if st.button("💾 Save All Assignments", key="save_monthly_btn"):
             # Get latest data from session state
             save_df = st.session_state.monthly_assignments_df
-            # Ensure Engineer Name is string type before saving and strip whitespace
-            save_df['Engineer Name'] = save_df['Engineer Name'].fillna('').astype(str).str.strip()
             # Save to CSV
-            save_df.to_csv(monthly_assignments_file, index=False)
+            save_csv(save_df, monthly_assignments_file)
             st.success("All monthly assignments saved!")
             st.rerun()  # Force refresh to update utilization
 
@@ -1776,19 +2143,24 @@ with assignment_tab2:
     if current_monthly_df.empty:
         st.info("No assignments to edit. Add some assignments first!")
     else:
-        # Create selection options
-        edit_options = []
-        for idx, row in current_monthly_df.iterrows():
-            allocation = row['Allocation %']
-            priority = row.get('Priority', 'Medium')
-            edit_options.append(f"{idx}: [{priority}] {row['Engineer Name']} - {row['Program']} - {row['Feature']} ({row['Month']}, {allocation}%)")
+        # Label each row index from plain row tuples instead of building a Series per row
+        option_columns = ['Priority', 'Engineer Name', 'Program', 'Feature', 'Month', 'Allocation %']
+        edit_labels = {
+            idx: f"{idx}: [{priority}] {engineer} - {program} - {feature} ({month}, {allocation}%)"
+            for idx, priority, engineer, program, feature, month, allocation in
+            current_monthly_df[option_columns].itertuples(index=True, name=None)
+        }
         
-        selected_to_edit = st.selectbox("Select assignment to edit:", options=edit_options, key="edit_assignment_select")
+        # The options are the row labels themselves, so the selection needs no parsing back out of the text
+        edit_idx = st.selectbox(
+            "Select assignment to edit:",
+            options=list(edit_labels),
+            format_func=edit_labels.__getitem__,
+            key="edit_assignment_select"
+        )
         
-        if selected_to_edit:
-            # Extract index from the selected option
-            edit_idx = int(selected_to_edit.split(":")[0])
-            assignment_to_edit = current_monthly_df.iloc[edit_idx]
+        if edit_idx is not None:
+            assignment_to_edit = current_monthly_df.loc[edit_idx]
             
             # Show edit form
             st.write("**Edit Assignment Details:**")
@@ -1796,13 +2168,6 @@ with assignment_tab2:
             col1, col2 = st.columns(2)
             
             with col1:
-                # Get valid engineers
-                engineer_list = engineers_df['Engineer Name'].tolist()
-                valid_engineers = []
-                for name in engineer_list:
-                    if name is not None and str(name).strip() and str(name) != 'nan':
-                        valid_engineers.append(str(name).strip())
-                
                 # Find current engineer index
                 current_engineer_idx = 0
                 try:
@@ -1847,11 +2212,7 @@ with assignment_tab2:
             
             with col5:
                 # Generate month options
-                current_date = datetime.now()
-                month_options = []
-                for i in range(12):
-                    month_date = current_date + timedelta(days=30*i)
-                    month_options.append(month_date.strftime("%Y-%m"))
+                month_options = get_next_months(12)
                 
                 # Find current month index
                 current_month_idx = 0
@@ -1898,23 +2259,22 @@ with assignment_tab2:
                     current_monthly_df.loc[edit_idx, 'Allocation %'] = edit_allocation
                     current_monthly_df.loc[edit_idx, 'Notes'] = edit_notes
                     
-                    # Ensure all engineer names are stripped
-                    current_monthly_df['Engineer Name'] = current_monthly_df['Engineer Name'].fillna('').astype(str).str.strip()
-                    
                     # Update session state
                     st.session_state.monthly_assignments_df = current_monthly_df
-                    
+
                     # Auto-save
-                    current_monthly_df.to_csv(monthly_assignments_file, index=False)
+                    save_csv(current_monthly_df, monthly_assignments_file)
                     st.success("Assignment updated and saved!")
                     st.rerun()
             
             with col2:
                 if st.button("🗑️ Delete This Assignment", key="delete_from_edit_btn"):
-                    updated_df = current_monthly_df.drop(index=edit_idx).reset_index(drop=True)
+                    # One masked take, then relabel in place so labels keep matching positions for the edit lookups
+                    updated_df = current_monthly_df[current_monthly_df.index != edit_idx]
+                    updated_df.index = pd.RangeIndex(len(updated_df))
                     st.session_state.monthly_assignments_df = updated_df
                     # Auto-save
-                    updated_df.to_csv(monthly_assignments_file, index=False)
+                    save_csv(updated_df, monthly_assignments_file)
                     st.success("Assignment deleted and saved!")
                     st.rerun()
 
@@ -1926,30 +2286,13 @@ if 'monthly_engineer' in st.session_state and st.session_state.monthly_engineer:
     # Get the latest monthly_df from session state
     current_monthly_df = st.session_state.monthly_assignments_df
     
-    # Ensure we're comparing strings properly
-    engineer_assignments = current_monthly_df[current_monthly_df['Engineer Name'].astype(str) == str(selected_engineer)].sort_values(['Priority', 'Month'])
+    # Cached on the frame contents and engineer, so reruns from unrelated widgets skip the rebuild
+    display_df, engineer_stats = build_engineer_assignment_view(current_monthly_df, str(selected_engineer))
     
-    if not engineer_assignments.empty:
-        # Create a formatted version for display
-        display_df = engineer_assignments.copy()
-        display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
-        
-        # Add priority color coding
-        def priority_color(priority):
-            colors = {
-                'Critical': '🔴',
-                'High': '🟠',
-                'Medium': '🟡',
-                'Low': '🟢'
-            }
-            return colors.get(priority, '⚪') + ' ' + priority
-        
-        if 'Priority' in display_df.columns:
-            display_df['Priority'] = display_df['Priority'].apply(priority_color)
-        
+    if display_df is not None:
         # Display the dataframe
         st.dataframe(
-            display_df[['Priority', 'Program', 'Feature', 'Month', 'Allocation %', 'Notes']], 
+            display_df, 
             use_container_width=True,
             hide_index=True
         )
@@ -1957,20 +2300,14 @@ if 'monthly_engineer' in st.session_state and st.session_state.monthly_engineer:
         # Quick stats for selected engineer
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            total_assignments = len(engineer_assignments)
-            st.metric("Total Assignments", total_assignments)
+            st.metric("Total Assignments", engineer_stats['total_assignments'])
         with col2:
-            unique_features = engineer_assignments['Feature'].nunique()
-            st.metric("Unique Features", unique_features)
+            st.metric("Unique Features", engineer_stats['unique_features'])
         with col3:
-            # Calculate average allocation
-            avg_allocation = engineer_assignments['Allocation %'].mean()
-            st.metric("Avg. Allocation", f"{avg_allocation:.1f}%")
+            st.metric("Avg. Allocation", f"{engineer_stats['avg_allocation']:.1f}%")
         with col4:
-            # Count critical/high priority items
-            if 'Priority' in engineer_assignments.columns:
-                critical_high = len(engineer_assignments[engineer_assignments['Priority'].isin(['Critical', 'High'])])
-                st.metric("Critical/High Priority", critical_high)
+            if engineer_stats['critical_high'] is not None:
+                st.metric("Critical/High Priority", engineer_stats['critical_high'])
     else:
         st.info(f"No assignments found for {selected_engineer}. Add one using the form above!")
 
@@ -1986,7 +2323,7 @@ if not current_monthly_df.empty:
     show_high_priority = st.checkbox("Show only Critical/High priority assignments", key="filter_high_priority")
     
     if show_high_priority and 'Priority' in current_monthly_df.columns:
-        filtered_df = current_monthly_df[current_monthly_df['Priority'].isin(['Critical', 'High'])]
+        filtered_df = current_monthly_df[high_priority_mask(current_monthly_df['Priority'])]
         if filtered_df.empty:
             st.info("No Critical or High priority assignments found.")
             current_monthly_df = st.session_state.monthly_assignments_df  # Reset to show all
@@ -1998,12 +2335,10 @@ if not current_monthly_df.empty:
     view_mode = st.radio("View Mode:", ["By Program", "By Month", "By Engineer", "All Assignments"], horizontal=True)
     
     if view_mode == "By Engineer":
-        # Group by engineer for better visualization
-        engineers_in_monthly = current_monthly_df['Engineer Name'].unique()
-        
-        for engineer in engineers_in_monthly:
+        # Group by engineer for better visualization (one partition pass instead of a full-column compare per engineer)
+        for engineer, engineer_assignments in current_monthly_df.groupby('Engineer Name', sort=False):
             if 'monthly_engineer' not in st.session_state or str(engineer) != str(st.session_state.monthly_engineer):  # Don't duplicate the selected engineer
-                engineer_assignments = current_monthly_df[current_monthly_df['Engineer Name'] == engineer].sort_values(['Priority', 'Month'])
+                engineer_assignments = engineer_assignments.sort_values(['Priority', 'Month'])
                 
                 with st.expander(f"📋 {engineer}'s Assignments ({len(engineer_assignments)} assignments)"):
                     if not engineer_assignments.empty:
@@ -2011,17 +2346,8 @@ if not current_monthly_df.empty:
                         display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
                         
                         # Add priority color coding
-                        def priority_color(priority):
-                            colors = {
-                                'Critical': '🔴',
-                                'High': '🟠',
-                                'Medium': '🟡',
-                                'Low': '🟢'
-                            }
-                            return colors.get(priority, '⚪') + ' ' + priority
-                        
                         if 'Priority' in display_df.columns:
-                            display_df['Priority'] = display_df['Priority'].apply(priority_color)
+                            display_df['Priority'] = label_priorities(display_df['Priority'])
                         
                         st.dataframe(
                             display_df[['Priority', 'Program', 'Feature', 'Month', 'Allocation %', 'Notes']], 
@@ -2042,17 +2368,8 @@ if not current_monthly_df.empty:
                     display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
                     
                     # Add priority color coding
-                    def priority_color(priority):
-                        colors = {
-                            'Critical': '🔴',
-                            'High': '🟠',
-                            'Medium': '🟡',
-                            'Low': '🟢'
-                        }
-                        return colors.get(priority, '⚪') + ' ' + priority
-                    
                     if 'Priority' in display_df.columns:
-                        display_df['Priority'] = display_df['Priority'].apply(priority_color)
+                        display_df['Priority'] = label_priorities(display_df['Priority'])
                     
                     st.dataframe(
                         display_df[['Priority', 'Engineer Name', 'Program', 'Feature', 'Allocation %', 'Notes']], 
@@ -2073,17 +2390,8 @@ if not current_monthly_df.empty:
                     display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
                     
                     # Add priority color coding
-                    def priority_color(priority):
-                        colors = {
-                            'Critical': '🔴',
-                            'High': '🟠',
-                            'Medium': '🟡',
-                            'Low': '🟢'
-                        }
-                        return colors.get(priority, '⚪') + ' ' + priority
-                    
                     if 'Priority' in display_df.columns:
-                        display_df['Priority'] = display_df['Priority'].apply(priority_color)
+                        display_df['Priority'] = label_priorities(display_df['Priority'])
                     
                     st.dataframe(
                         display_df[['Priority', 'Engineer Name', 'Feature', 'Month', 'Allocation %', 'Notes']], 
@@ -2096,17 +2404,8 @@ if not current_monthly_df.empty:
         display_df['Allocation %'] = display_df['Allocation %'].apply(lambda x: f"{x}%" if isinstance(x, (int, float)) else x)
         
         # Add priority color coding
-        def priority_color(priority):
-            colors = {
-                'Critical': '🔴',
-                'High': '🟠',
-                'Medium': '🟡',
-                'Low': '🟢'
-            }
-            return colors.get(priority, '⚪') + ' ' + priority
-        
         if 'Priority' in display_df.columns:
-            display_df['Priority'] = display_df['Priority'].apply(priority_color)
+            display_df['Priority'] = label_priorities(display_df['Priority'])
         
         st.dataframe(
             display_df[['Priority', 'Engineer Name', 'Program', 'Feature', 'Month', 'Allocation %', 'Notes']], 
@@ -2129,35 +2428,30 @@ with col2:
         # Force reload all data
         try:
             # Reload engineers
-            loaded_df = pd.read_csv(engineer_file)
+            loaded_df = read_csv_cached(engineer_file)
             if 'PTO Days' in loaded_df.columns:
                 loaded_df = loaded_df.drop(columns=['PTO Days'])
-            loaded_df['Engineer Name'] = loaded_df['Engineer Name'].fillna('').astype(str).str.strip()
-            # Remove completely empty rows
-            loaded_df = loaded_df[loaded_df.astype(str).ne('').any(axis=1)]
+            normalize_engineer_names(loaded_df)
+            # Remove rows without an engineer name (names are already normalized, so no full-frame cast is needed)
+            loaded_df = loaded_df[loaded_df['Engineer Name'] != '']
             
             # Ensure Skills column exists
             if "Skills" not in loaded_df.columns:
                 loaded_df["Skills"] = ""
             
             # Ensure PTO columns exist
-            current_date = datetime.now()
-            for i in range(12):
-                month_date = current_date + timedelta(days=30*i)
-                month_key = f"PTO_{month_date.strftime('%Y_%m')}"
-                if month_key not in loaded_df.columns:
-                    loaded_df[month_key] = 0
+            loaded_df, _ = add_missing_pto_columns(loaded_df, get_next_months(12, date_format="PTO_%Y_%m"))
             
             # Recalculate Annual PTO
-            pto_columns = [col for col in loaded_df.columns if col.startswith("PTO_")]
+            pto_columns = get_pto_columns(loaded_df)
             if pto_columns:
                 loaded_df['Annual PTO Days'] = loaded_df[pto_columns].sum(axis=1)
             
             st.session_state.engineers_df = loaded_df
             
             # Reload monthly assignments
-            loaded_monthly = pd.read_csv(monthly_assignments_file)
-            loaded_monthly['Engineer Name'] = loaded_monthly['Engineer Name'].fillna('').astype(str).str.strip()
+            loaded_monthly = read_csv_cached(monthly_assignments_file)
+            normalize_engineer_names(loaded_monthly)
             loaded_monthly['Allocation %'] = pd.to_numeric(loaded_monthly['Allocation %'], errors='coerce').fillna(0)
             if 'Program' not in loaded_monthly.columns:
                 loaded_monthly['Program'] = 'Default Program'
@@ -2169,13 +2463,12 @@ with col2:
         st.rerun()
 
 # Always get the latest monthly assignments from session state
-if 'monthly_assignments_df' in st.session_state:
-    monthly_df = st.session_state.monthly_assignments_df
-else:
+monthly_df = st.session_state.get('monthly_assignments_df')
+if monthly_df is None:
     try:
-        monthly_df = pd.read_csv(monthly_assignments_file)
+        monthly_df = read_csv_cached(monthly_assignments_file)
         # Ensure proper data types
-        monthly_df['Engineer Name'] = monthly_df['Engineer Name'].fillna('').astype(str)
+        normalize_engineer_names(monthly_df)
         monthly_df['Allocation %'] = pd.to_numeric(monthly_df['Allocation %'], errors='coerce').fillna(0)
         if 'Program' not in monthly_df.columns:
             monthly_df['Program'] = 'Default Program'
@@ -2188,40 +2481,20 @@ else:
 
 try:
     # First check if we have any engineers
-    if engineers_df.empty or not any(engineers_df['Engineer Name'].str.strip() != ''):
+    # Names are normalized wherever they enter the session frame, so a plain compare finds the blank rows
+    if engineers_df.empty or not (engineers_df['Engineer Name'] != '').any():
         st.warning("No engineers found. Please add engineers in the Engineer Management section first.")
     else:
         # Generate utilization summary with current data
-        availability_summary, availability_details = generate_monthly_utilization_chart(monthly_df, engineers_df)
+        availability_summary, availability_details = get_utilization_summary(monthly_df, engineers_df)
         
         if availability_summary is not None and not availability_summary.empty:
             st.subheader("Engineer Availability Overview")
             
-            # Color-code the availability summary
-            def color_status(val):
-                if 'Over-allocated' in str(val):
-                    return 'background-color: #FF9999'
-                elif 'Fully occupied' in str(val):
-                    return 'background-color: #FFEB99'
-                else:
-                    return 'background-color: #CCFFCC'
-            
-            def color_availability(val):
-                try:
-                    # Remove % sign and convert to float
-                    val_float = float(str(val).replace('%', ''))
-                    if val_float <= 0:
-                        return 'background-color: #FF9999'  # Red for no availability
-                    elif val_float <= 20:
-                        return 'background-color: #FFEB99'  # Yellow for low availability
-                    else:
-                        return 'background-color: #CCFFCC'  # Green for good availability
-                except:
-                    return ''
-            
             # Check if required columns exist before styling
             if 'Status' in availability_summary.columns:
-                styled_summary = availability_summary.style
+                # Color-code the availability summary; percentages stay numeric and are formatted here
+                styled_summary = availability_summary.style.format(SUMMARY_PERCENT_FORMAT)
                 if 'Status' in availability_summary.columns:
                     styled_summary = styled_summary.map(color_status, subset=['Status'])
                 if 'Current Quarter Availability' in availability_summary.columns and 'Avg. Quarterly Availability' in availability_summary.columns:
@@ -2236,57 +2509,30 @@ try:
                 # Create pivot table for better visualization
                 if not availability_details.empty:
                     try:
-                        pivot_data = []
-                        for _, row in availability_details.iterrows():
-                            pivot_data.append({
-                                'Engineer': row['Engineer'],
-                                'Quarter': row['Quarter'],
-                                'Allocation %': row['Effective Allocation %'],
-                                'Available %': row['Available %'],
-                                'Working Days': row['Working Days']
-                            })
-                        
-                        pivot_df = pd.DataFrame(pivot_data)
+                        # One row per (Engineer, Quarter), so a plain unstack replaces the pivot_table aggregation
+                        pivot_df = availability_details[['Engineer', 'Quarter', 'Effective Allocation %', 'Available %']].rename(
+                            columns={'Effective Allocation %': 'Allocation %'}
+                        ).astype({'Allocation %': float, 'Available %': float})
                         if not pivot_df.empty and len(pivot_df['Engineer'].unique()) > 0 and len(pivot_df['Quarter'].unique()) > 0:
-                            pivot_table = pivot_df.pivot_table(
-                                index='Engineer',
-                                columns='Quarter',
-                                values=['Available %', 'Allocation %'],
-                                fill_value=100
-                            )
+                            pivot_indexed = pivot_df.set_index(['Engineer', 'Quarter'])
+                            availability_pivot = pivot_indexed['Available %'].unstack('Quarter', fill_value=100)
+                            allocation_pivot = pivot_indexed['Allocation %'].unstack('Quarter', fill_value=100)
                             
                             # Sort columns chronologically
-                            quarters = pivot_table.columns.get_level_values(1).unique()
-                            sorted_quarters = sort_quarters_chronologically(quarters.tolist())
+                            sorted_quarters = sort_quarters_chronologically(availability_pivot.columns.tolist())
                             
                             st.write("**Quarterly Availability % by Engineer:**")
-                            availability_pivot = pivot_table['Available %'][sorted_quarters]
+                            availability_pivot = availability_pivot[sorted_quarters]
                             
                             # Apply color coding to the pivot table
-                            def color_cell(val):
-                                if val <= 0:
-                                    return 'background-color: #FF9999; color: white'
-                                elif val <= 20:
-                                    return 'background-color: #FFEB99'
-                                else:
-                                    return 'background-color: #CCFFCC'
-                            
-                            styled_pivot = availability_pivot.style.map(color_cell)
+                            styled_pivot = availability_pivot.style.apply(color_availability_pivot, axis=None)
                             st.dataframe(styled_pivot, use_container_width=True)
                             
                             st.write("**Quarterly Allocation % by Engineer:**")
-                            allocation_pivot = pivot_table['Allocation %'][sorted_quarters]
+                            allocation_pivot = allocation_pivot[sorted_quarters]
                             
                             # Apply color coding to allocation
-                            def color_allocation(val):
-                                if val >= 100:
-                                    return 'background-color: #FF9999; color: white'
-                                elif val >= 80:
-                                    return 'background-color: #FFEB99'
-                                else:
-                                    return 'background-color: #CCFFCC'
-                            
-                            styled_allocation = allocation_pivot.style.map(color_allocation)
+                            styled_allocation = allocation_pivot.style.apply(color_allocation_pivot, axis=None)
                             st.dataframe(styled_allocation, use_container_width=True)
                         else:
                             st.info("No data available for pivot table. Add more assignments to see the breakdown.")
@@ -2307,7 +2553,7 @@ try:
                 
                 # Filter data for current quarter
                 monthly_df_with_quarter = monthly_df.copy()
-                monthly_df_with_quarter['Quarter'] = monthly_df_with_quarter['Month'].apply(get_fiscal_quarter)
+                monthly_df_with_quarter['Quarter'] = get_fiscal_quarter_series(monthly_df_with_quarter['Month'])
                 current_quarter_data = monthly_df_with_quarter[monthly_df_with_quarter['Quarter'] == current_quarter_calc]
                 
                 st.write(f"**Current Quarter: {current_quarter_calc}**")
@@ -2390,16 +2636,13 @@ if not monthly_df.empty and not engineers_df.empty:
     current_quarter = get_fiscal_quarter(current_month)
     
     # Get months in current quarter
-    all_months = []
-    for i in range(12):
-        month_date = current_date + timedelta(days=30*i)
-        all_months.append(month_date.strftime("%Y-%m"))
+    all_months = get_next_months(12)
     
     current_quarter_months = get_quarter_months(current_quarter)
     
     # Filter for current quarter
     monthly_df_temp = monthly_df.copy()
-    monthly_df_temp['Quarter'] = monthly_df_temp['Month'].apply(get_fiscal_quarter)
+    monthly_df_temp['Quarter'] = get_fiscal_quarter_series(monthly_df_temp['Month'])
     current_quarter_data = monthly_df_temp[monthly_df_temp['Quarter'] == current_quarter]
     
     # Calculate metrics
@@ -2421,7 +2664,7 @@ if not monthly_df.empty and not engineers_df.empty:
     
     with col4:
         if 'Priority' in current_quarter_data.columns:
-            critical_high = len(current_quarter_data[current_quarter_data['Priority'].isin(['Critical', 'High'])])
+            critical_high = int(high_priority_mask(current_quarter_data['Priority']).sum())
             st.metric("Critical/High Priority", critical_high)
         else:
             st.metric("Critical/High Priority", "N/A")
@@ -2435,7 +2678,7 @@ with quarterly_tab1:
     st.subheader(f"Engineer {chart_mode.replace('Show ', '')} by Quarter")
     
     # Generate quarterly availability/allocation chart
-    quarterly_chart_fig = generate_quarterly_availability_chart(monthly_df, engineers_df, show_allocation=show_allocation)
+    quarterly_chart_fig = generate_quarterly_availability_chart(monthly_df, engineers_df, datetime.now().strftime("%Y-%m-%d"), show_allocation=show_allocation)
     if quarterly_chart_fig:
         st.plotly_chart(quarterly_chart_fig, use_container_width=True)
     else:
@@ -2450,7 +2693,8 @@ with quarterly_tab2:
     if not monthly_df.empty:
         # Add quarter column
         monthly_df_with_quarter = monthly_df.copy()
-        monthly_df_with_quarter['Quarter'] = monthly_df_with_quarter['Month'].apply(get_fiscal_quarter)
+        monthly_df_with_quarter['Quarter'] = get_fiscal_quarter_series(monthly_df_with_quarter['Month'])
+        categorize_assignment_labels(monthly_df_with_quarter)
         
         # Get all unique quarters
         all_quarters = monthly_df_with_quarter['Quarter'].unique()
@@ -2462,11 +2706,8 @@ with quarterly_tab2:
                 st.subheader("Total Allocation by Program per Quarter")
                 
                 # Calculate total allocation for each program/quarter
-                program_quarterly = monthly_df_with_quarter.groupby(['Quarter', 'Program'])['Allocation %'].sum().reset_index()
-                program_quarterly.rename(columns={'Allocation %': 'Total Allocation %'}, inplace=True)
-                
                 # Create pivot for side-by-side comparison
-                program_pivot = program_quarterly.pivot(index='Program', columns='Quarter', values='Total Allocation %').fillna(0)
+                program_pivot = monthly_df_with_quarter.groupby(['Quarter', 'Program'], observed=True)['Allocation %'].sum().unstack('Quarter', fill_value=0)
                 program_pivot = program_pivot[sorted_quarters]  # Ensure proper quarter order
                 
                 # Create grouped bar chart
@@ -2477,7 +2718,7 @@ with quarterly_tab2:
                             name=quarter,
                             x=program_pivot.index,
                             y=program_pivot[quarter],
-                            text=program_pivot[quarter].apply(lambda x: f"{x:.1f}%"),
+                            text=[f"{x:.1f}%" for x in program_pivot[quarter].tolist()],
                             textposition='auto',
                         ))
                 
@@ -2494,16 +2735,13 @@ with quarterly_tab2:
             st.subheader("Total Allocation by Top Features per Quarter")
             
             # Get top features based on total allocation across all quarters
-            feature_totals = monthly_df_with_quarter.groupby('Feature')['Allocation %'].sum()
-            top_features = feature_totals.nlargest(8).index.tolist()
+            top_features = top_category_labels(monthly_df_with_quarter['Feature'], monthly_df_with_quarter['Allocation %'], 8)
             
             # Filter for top features
             feature_quarterly = monthly_df_with_quarter[monthly_df_with_quarter['Feature'].isin(top_features)]
-            feature_quarterly = feature_quarterly.groupby(['Quarter', 'Feature'])['Allocation %'].sum().reset_index()
-            feature_quarterly.rename(columns={'Allocation %': 'Total Allocation %'}, inplace=True)
             
             # Create pivot
-            feature_pivot = feature_quarterly.pivot(index='Feature', columns='Quarter', values='Total Allocation %').fillna(0)
+            feature_pivot = feature_quarterly.groupby(['Quarter', 'Feature'], observed=True)['Allocation %'].sum().unstack('Quarter', fill_value=0)
             feature_pivot = feature_pivot[sorted_quarters]  # Ensure proper quarter order
             
             # Create grouped bar chart
@@ -2514,7 +2752,7 @@ with quarterly_tab2:
                         name=quarter,
                         x=feature_pivot.index,
                         y=feature_pivot[quarter],
-                        text=feature_pivot[quarter].apply(lambda x: f"{x:.1f}%"),
+                        text=[f"{x:.1f}%" for x in feature_pivot[quarter].tolist()],
                         textposition='auto',
                     ))
             
@@ -2532,12 +2770,9 @@ with quarterly_tab2:
             if 'Priority' in monthly_df_with_quarter.columns:
                 st.subheader("Total Allocation by Priority per Quarter")
                 
-                priority_quarterly = monthly_df_with_quarter.groupby(['Quarter', 'Priority'])['Allocation %'].sum().reset_index()
-                priority_quarterly.rename(columns={'Allocation %': 'Total Allocation %'}, inplace=True)
-                
                 # Create pivot
                 priority_order = ['Critical', 'High', 'Medium', 'Low']
-                priority_pivot = priority_quarterly.pivot(index='Priority', columns='Quarter', values='Total Allocation %').fillna(0)
+                priority_pivot = monthly_df_with_quarter.groupby(['Quarter', 'Priority'], observed=True)['Allocation %'].sum().unstack('Quarter', fill_value=0)
                 priority_pivot = priority_pivot.reindex(priority_order, fill_value=0)  # Ensure priority order
                 priority_pivot = priority_pivot[sorted_quarters]  # Ensure proper quarter order
                 
@@ -2551,7 +2786,7 @@ with quarterly_tab2:
                             name=quarter,
                             x=priority_pivot.index,
                             y=priority_pivot[quarter],
-                            text=priority_pivot[quarter].apply(lambda x: f"{x:.1f}%"),
+                            text=[f"{x:.1f}%" for x in priority_pivot[quarter].tolist()],
                             textposition='auto',
                         ))
                 
@@ -2568,18 +2803,16 @@ with quarterly_tab2:
             st.subheader("Total Allocation by Engineer per Quarter")
             
             # Calculate total allocation per engineer per quarter
-            engineer_quarterly = monthly_df_with_quarter.groupby(['Quarter', 'Engineer Name'])['Allocation %'].sum().reset_index()
-            engineer_quarterly.rename(columns={'Allocation %': 'Total Allocation %'}, inplace=True)
+            engineer_quarterly = monthly_df_with_quarter.groupby(['Quarter', 'Engineer Name'], observed=True)['Allocation %'].sum()
             
             # For better visualization, show top 15 engineers by total allocation
-            engineer_totals = engineer_quarterly.groupby('Engineer Name')['Total Allocation %'].sum()
-            top_engineers = engineer_totals.nlargest(15).index.tolist()
+            top_engineers = top_category_labels(monthly_df_with_quarter['Engineer Name'], monthly_df_with_quarter['Allocation %'], 15)
             
             # Filter for top engineers
-            engineer_quarterly_top = engineer_quarterly[engineer_quarterly['Engineer Name'].isin(top_engineers)]
+            engineer_quarterly_top = engineer_quarterly[engineer_quarterly.index.get_level_values('Engineer Name').isin(top_engineers)]
             
             # Create pivot
-            engineer_pivot = engineer_quarterly_top.pivot(index='Engineer Name', columns='Quarter', values='Total Allocation %').fillna(0)
+            engineer_pivot = engineer_quarterly_top.unstack('Quarter', fill_value=0)
             engineer_pivot = engineer_pivot[sorted_quarters]  # Ensure proper quarter order
             
             # Sort engineers by their total allocation
@@ -2594,7 +2827,7 @@ with quarterly_tab2:
                         name=quarter,
                         x=engineer_pivot.index,
                         y=engineer_pivot[quarter],
-                        text=engineer_pivot[quarter].apply(lambda x: f"{x:.1f}%"),
+                        text=[f"{x:.1f}%" for x in engineer_pivot[quarter].tolist()],
                         textposition='auto',
                     ))
             
@@ -2634,7 +2867,7 @@ with quarterly_tab3:
     st.subheader("Quarterly Trends Analysis")
     
     # Team utilization summary
-    team_summary_fig = generate_team_utilization_summary(monthly_df, engineers_df)
+    team_summary_fig = generate_team_utilization_summary(monthly_df, engineers_df, datetime.now().strftime("%Y-%m-%d"))
     if team_summary_fig:
         st.plotly_chart(team_summary_fig, use_container_width=True)
     else:
@@ -2662,34 +2895,46 @@ st.header("🚀 Future Projects Planning")
 # Initialize Future Projects DataFrame
 if "future_projects_df" not in st.session_state:
     try:
-        loaded_future_df = pd.read_csv(future_projects_file)
-        # Ensure string columns are properly typed
-        string_columns = ['Project Name', 'Required Skills', 'Priority', 'Status', 'Notes']
-        for col in string_columns:
-            if col in loaded_future_df.columns:
-                loaded_future_df[col] = loaded_future_df[col].fillna('').astype(str)
-        st.session_state.future_projects_df = loaded_future_df
+        st.session_state.future_projects_df = load_future_projects(future_projects_file)
     except FileNotFoundError:
         st.session_state.future_projects_df = default_future_projects()
+    categorize_future_priority(st.session_state.future_projects_df)
 
 future_projects_df = st.session_state.future_projects_df
 
 if st.button("➕ Add Future Project Row", key="add_future_row"):
-    new_future_row = {col: "" if col not in ["Estimated Engineer Count"] else 1 for col in future_projects_df.columns}
-    future_projects_df = pd.concat([future_projects_df, pd.DataFrame([new_future_row])], ignore_index=True)
+    # Ensure the next row label is len(df) so enlargement appends instead of overwriting
+    if not future_projects_df.index.equals(pd.RangeIndex(len(future_projects_df))):
+        future_projects_df = future_projects_df.reset_index(drop=True)
+    future_projects_df.loc[len(future_projects_df)] = [
+        "" if col != "Estimated Engineer Count" else 1 for col in future_projects_df.columns
+    ]
+    # Row enlargement upcasts categoricals to object, so restore the Priority categories
+    categorize_future_priority(future_projects_df)
     st.session_state.future_projects_df = future_projects_df
 
 # Expander to rename future project columns
 with st.expander("Rename Future Project Columns", expanded=False):
-    future_renames = {}
-    for col in future_projects_df.columns:
-        new_col = st.text_input(f"Rename '{col}' to:", value=col, key=f"rename_future_{col}")
-        future_renames[col] = new_col
+    # One editor for all column names instead of a text input per column
+    future_columns = list(future_projects_df.columns)
+    edited_future_renames = st.data_editor(
+        pd.DataFrame({'Current Name': future_columns, 'New Name': future_columns}),
+        disabled=['Current Name'],
+        hide_index=True,
+        use_container_width=True,
+        # Ensure a fresh editor when the column set changes so stale edits are not replayed
+        key=f"rename_future_columns_{hash(tuple(future_columns))}"
+    )
     if st.button("Apply Future Project Renames", key="apply_future_renames"):
+        # Blank entries keep the current name
+        future_renames = {
+            current: str(new).strip() or current
+            for current, new in zip(edited_future_renames['Current Name'], edited_future_renames['New Name'].fillna(''))
+        }
         future_projects_df = future_projects_df.rename(columns=future_renames)
         st.session_state.future_projects_df = future_projects_df
-        # Save the renamed dataframe to CSV to persist changes
-        future_projects_df.to_csv(future_projects_file, index=False)
+        # Mark dirty; the frame is written once at the end of this run
+        st.session_state.future_dirty = True
         st.success("Future project column names updated and saved!")
 
 # Expander for modifying future project columns
@@ -2698,24 +2943,22 @@ with st.expander("Modify Future Project Columns", expanded=False):
     future_col_to_delete = st.selectbox("Select column to delete:", options=future_cols, key="delete_future_col")
     if st.button("Delete Column", key="del_future_col_btn"):
         if future_col_to_delete in future_projects_df.columns:
+            # future_projects_df is the session-state frame, so the in-place drop already updates it
             future_projects_df.drop(columns=[future_col_to_delete], inplace=True)
-            st.session_state.future_projects_df = future_projects_df
-            # Save changes to CSV to persist
-            future_projects_df.to_csv(future_projects_file, index=False)
+            st.session_state.future_dirty = True
             st.success(f"Deleted column '{future_col_to_delete}' and saved changes")
     
     new_future_col_name = st.text_input("New column name:", key="new_future_col_name")
     if st.button("Add Column", key="add_future_col_btn"):
         if new_future_col_name and new_future_col_name not in future_projects_df.columns:
             future_projects_df[new_future_col_name] = ""
-            st.session_state.future_projects_df = future_projects_df
-            # Save changes to CSV to persist
-            future_projects_df.to_csv(future_projects_file, index=False)
+            st.session_state.future_dirty = True
             st.success(f"Added column '{new_future_col_name}' and saved changes")
         else:
             st.error("Invalid or duplicate column name.")
 
 if aggrid_available:
+    AgGrid, GridOptionsBuilder = get_aggrid()
     # Build grid options for future projects
     gb_future = GridOptionsBuilder.from_dataframe(future_projects_df)
     gb_future.configure_default_column(editable=True)
@@ -2728,7 +2971,18 @@ if aggrid_available:
         update_mode='VALUE_CHANGED',
         key='future_grid'
     )
-    future_projects_df = pd.DataFrame(future_response['data'])
+    # Rebuild the frame only when the grid returned different data (older st_aggrid returns records, newer a DataFrame)
+    future_grid_data = future_response['data']
+    if isinstance(future_grid_data, pd.DataFrame):
+        future_grid_sig = frame_signature(future_grid_data)
+    else:
+        future_grid_sig = (len(future_grid_data), hash(json.dumps(future_grid_data, sort_keys=True, default=str)))
+    if future_grid_sig != st.session_state.get('_future_grid_sig'):
+        grid_df = pd.DataFrame(future_grid_data)
+        # Apply just the edited columns when the grid kept the frame's shape, otherwise take the grid as-is
+        edited_df = apply_grid_edits(future_projects_df, grid_df)
+        future_projects_df = categorize_future_priority(grid_df if edited_df is None else edited_df)
+        st.session_state._future_grid_sig = future_grid_sig
     st.session_state.future_projects_df = future_projects_df
 else:
     # Fallback to regular data editor
@@ -2736,26 +2990,26 @@ else:
     st.session_state.future_projects_df = future_projects_df
 
 if st.button("💾 Save Future Projects Changes", key="save_future_btn"):
-    future_projects_df.to_csv(future_projects_file, index=False)
+    flush_future_projects(future_projects_df, future_projects_file, force=True)
     st.success("Future projects data saved!")
 
 # Future Projects Summary
 st.subheader("📊 Future Projects Summary")
+# Only the two columns the metrics read are passed, which keeps the cache key cheap to hash
+total_future_projects, total_engineers_needed, high_priority_count = summarize_future_projects(
+    len(future_projects_df),
+    future_projects_df['Priority'] if 'Priority' in future_projects_df.columns else None,
+    future_projects_df['Estimated Engineer Count'] if 'Estimated Engineer Count' in future_projects_df.columns else None
+)
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    total_future_projects = len(future_projects_df)
     st.metric("Total Future Projects", total_future_projects)
 
 with col2:
-    try:
-        total_engineers_needed = future_projects_df['Estimated Engineer Count'].astype(float).sum()
-        st.metric("Total Engineers Needed", int(total_engineers_needed))
-    except:
-        st.metric("Total Engineers Needed", "N/A")
+    st.metric("Total Engineers Needed", int(total_engineers_needed) if not pd.isna(total_engineers_needed) else "N/A")
 
 with col3:
-    high_priority_count = len(future_projects_df[future_projects_df.get('Priority', '') == 'High'])
     st.metric("High Priority Projects", high_priority_count)
 
 # ─────────────────────────────────────────────────────────────
@@ -2765,16 +3019,14 @@ with col3:
 st.header("🔍 Engineer Capacity vs Future Projects Analysis")
 
 # Get current engineers count
-total_engineers = len(engineers_df[engineers_df['Engineer Name'].str.strip() != ''])
+total_engineers = int((engineers_df['Engineer Name'] != '').sum())
 
 # Get future projects data
 if 'future_projects_df' in st.session_state and not st.session_state.future_projects_df.empty:
     future_df = st.session_state.future_projects_df
     
-    # Calculate total engineers needed
-    try:
-        total_engineers_needed = future_df['Estimated Engineer Count'].astype(float).sum()
-    except:
+    # Reuse the engineers-needed total from the summary above (same frame); no numeric counts means 0
+    if pd.isna(total_engineers_needed):
         total_engineers_needed = 0
     
     # Create main comparison metrics
@@ -2810,7 +3062,7 @@ if 'future_projects_df' in st.session_state and not st.session_state.future_proj
     # Get available engineers by quarter
     if not monthly_df.empty:
         # Calculate availability by quarter
-        availability_summary, availability_details = generate_monthly_utilization_chart(monthly_df, engineers_df)
+        availability_summary, availability_details = get_utilization_summary(monthly_df, engineers_df)
         
         # Get future projects by quarter
         future_by_quarter = {}
@@ -2934,6 +3186,12 @@ if 'future_projects_df' in st.session_state and not st.session_state.future_proj
             if not shortage_quarters.empty:
                 st.warning(f"⚠️ Engineer shortage detected in {len(shortage_quarters)} quarter(s)")
                 
+                # First Skills value per engineer name, so listed engineers are a dict lookup instead of a mask + iloc each
+                skills_by_engineer = {}
+                if 'Skills' in engineers_df.columns:
+                    first_rows = ~engineers_df['Engineer Name'].duplicated()
+                    skills_by_engineer = dict(zip(engineers_df['Engineer Name'][first_rows], engineers_df['Skills'][first_rows]))
+                
                 for _, quarter_data in shortage_quarters.iterrows():
                     quarter = quarter_data['Quarter']
                     gap = abs(quarter_data['Gap'])
@@ -2943,12 +3201,7 @@ if 'future_projects_df' in st.session_state and not st.session_state.future_proj
                         if quarter in future_by_quarter:
                             st.write("**Projects requiring engineers:**")
                             for project in future_by_quarter[quarter]['projects']:
-                                priority_icon = {
-                                    'Critical': '🔴',
-                                    'High': '🟠',
-                                    'Medium': '🟡',
-                                    'Low': '🟢'
-                                }.get(project['priority'], '⚪')
+                                priority_icon = PRIORITY_ICONS.get(project['priority'], '⚪')
                                 st.write(f"- {priority_icon} {project['name']} ({project['engineers']} engineers)")
                                 # Show required skills for this project
                                 if project['name'] in project_skills_map:
@@ -2965,22 +3218,12 @@ if 'future_projects_df' in st.session_state and not st.session_state.future_proj
                         available_eng = quarter_avail[quarter_avail['Available %'] > 20].sort_values('Available %', ascending=False)
                         
                         if not available_eng.empty:
-                            for _, eng in available_eng.iterrows():
-                                engineer_name = eng['Engineer']
-                                # Get engineer skills if available
-                                if 'Skills' in engineers_df.columns:
-                                    engineer_match = engineers_df[engineers_df['Engineer Name'] == engineer_name]
-                                    if not engineer_match.empty:
-                                        skills = engineer_match.iloc[0]['Skills']
-                                        if skills and str(skills).strip():
-                                            st.write(f"- {engineer_name} ({eng['Available %']:.1f}% available)")
-                                            st.caption(f"  Skills: {skills}")
-                                        else:
-                                            st.write(f"- {engineer_name} ({eng['Available %']:.1f}% available)")
-                                    else:
-                                        st.write(f"- {engineer_name} ({eng['Available %']:.1f}% available)")
-                                else:
-                                    st.write(f"- {engineer_name} ({eng['Available %']:.1f}% available)")
+                            for engineer_name, available in zip(available_eng['Engineer'].tolist(), available_eng['Available %'].tolist()):
+                                st.write(f"- {engineer_name} ({available:.1f}% available)")
+                                # Show engineer skills if available
+                                skills = skills_by_engineer.get(engineer_name)
+                                if skills and str(skills).strip():
+                                    st.caption(f"  Skills: {skills}")
                         else:
                             st.write("No engineers with >20% availability")
     else:
@@ -3187,3 +3430,7 @@ if st.button("Generate Excel File with All Data", key="export_excel"):
     except Exception as e:
         st.error(f"Error generating Excel file: {str(e)}")
         st.info("This might be due to invalid data. Please check your data and try again.")
+
+# Write any future project changes marked dirty during this run
+if 'future_projects_df' in st.session_state:
+    flush_future_projects(st.session_state.future_projects_df, future_projects_file)